@@ -4,42 +4,66 @@ HOTDOG AI Document Analysis with Real-Time SSE Progress
 
 Architecture: Threading-based (simple, proven, works)
 """
+import os
+
 # CRITICAL: Gevent monkey patching MUST be first (before any other imports)
 # This makes socket/queue work with gevent workers
 # thread=False prevents conflicts with threading.Thread in analysis
-try:
-    from gevent import monkey
-    monkey.patch_all(thread=False, select=False)
-    GEVENT_PATCHED = True
-except ImportError:
-    # Gevent not installed (development mode) - continue without patching
+# Skipped under gunicorn's threaded workers (gunicorn_config.py exports the class):
+# requests there run on real threads, and with preload_app the worker's own
+# thread pool would be built on a gevent queue and die with LoopExit.
+if os.environ.get('GUNICORN_WORKER_CLASS') in ('gthread', 'sync'):
     GEVENT_PATCHED = False
+else:
+    try:
+        from gevent import monkey
+        monkey.patch_all(thread=False, select=False)
+        GEVENT_PATCHED = True
+    except ImportError:
+        # Gevent not installed (development mode) - continue without patching
+        GEVENT_PATCHED = False
+
+# Requests are greenlets on a running gevent hub (not just patched sockets, as under the dev server)
+GEVENT_WORKER = GEVENT_PATCHED and os.environ.get('GUNICORN_WORKER_CLASS') == 'gevent'
 
-import os
 import sys
 import logging
 import threading
-import queue
 import json
 import tempfile
+import atexit
+import shutil
+import gzip
 import hashlib
+import hmac
+import functools
+import itertools
+import mimetypes
 import secrets
 import time
-from datetime import datetime, timedelta
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
 from pathlib import Path
+from urllib.parse import quote, unquote
+from dataclasses import dataclass, field
+from typing import Optional
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
 load_dotenv()  # CRITICAL: Must be called before any os.getenv() usage
 
-from flask import Flask, request, jsonify, Response, stream_with_context, send_from_directory, send_file
+from flask import Flask, Request, request, jsonify, Response, stream_with_context, send_from_directory, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import ClientDisconnected
+from werkzeug.http import http_date, quote_etag
 
-# Import HOTDOG orchestrator
-from services.hotdog import HotdogOrchestrator
-# Excel dashboard import moved to lazy load (only when endpoint is called)
-# This prevents app crash if openpyxl isn't installed
+from services.session_store import create_session_store
+# HOTDOG (openai + PyMuPDF, ~0.5s of imports) and the Excel dashboard are imported
+# where they're used, so workers that only serve pages/health don't pay for them.
+# gunicorn_config.py imports HOTDOG in the preloading master so workers share it.
 import asyncio
 
 # Configure logging
@@ -50,51 +74,233 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Diagnostic: Log Python and gevent environment
-logger.info(f"🐍 Python {sys.version.split()[0]} at {sys.executable}")
+logger.info("🐍 Python %s at %s", sys.version.split()[0], sys.executable)
 if GEVENT_PATCHED:
     try:
         import gevent
-        logger.info(f"✅ gevent {gevent.__version__} installed and patched (thread=False)")
+        logger.info("✅ gevent %s installed and patched (thread=False)", gevent.__version__)
     except:
-        logger.warning(f"⚠️ Gevent patch attempted but module import failed")
+        logger.warning("⚠️ Gevent patch attempted but module import failed")
 else:
-    logger.warning(f"⚠️ gevent NOT installed - SSE will not work with sync workers!")
+    logger.warning("⚠️ gevent NOT installed - SSE will not work with sync workers!")
 
 # Configuration
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+    # Read once at import (after load_dotenv) - rotating the key means a restart anyway
+    OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB
+    UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MiB copy buffer for uploads (vs Werkzeug's 16KiB)
+    # Upload scratch space: the system temp dir (on disk). Uploads are kept until the
+    # process exits, so a RAM-backed dir like /dev/shm would hold every analysed PDF
+    # in the container's memory - opt in via UPLOAD_TMP_DIR only with memory to spare.
+    # Uploads spill to the system temp dir when the chosen one runs low.
+    UPLOAD_TMP_DIR = os.getenv('UPLOAD_TMP_DIR')  # None = system temp dir
+    UPLOAD_TMP_HEADROOM = 64 * 1024 * 1024  # keep this much of UPLOAD_TMP_DIR's fs free
     BASE_DIR = Path(__file__).parent
+    BASE_DIR_STR = str(BASE_DIR.resolve())
+
+    # Production defaults - DEBUG only comes on via the dev server (__main__ with DEBUG=true).
+    # No template mtime checks or loader tracing; errors go to our JSON handlers.
+    DEBUG = False
+    TEMPLATES_AUTO_RELOAD = False
+    EXPLAIN_TEMPLATE_LOADING = False
+    PROPAGATE_EXCEPTIONS = False
+
+    # File locations resolved once at import - they never change at runtime
+    SHARED_DIR = BASE_DIR / 'shared'
+    PROGRESS_ESTIMATOR_DIR = BASE_DIR / 'legacy' / 'apps' / 'progress-estimator'
+    QUESTIONS_CONFIG_PATH = BASE_DIR / 'config' / 'cipp_questions_default.json'
+    QUESTIONS_CONFIG_FILE = str(QUESTIONS_CONFIG_PATH)
+    SHARED_DIR_STR = str(SHARED_DIR)  # send_from_directory takes str; skip os.fspath per asset
+
+    # Browser cache lifetime for HTML/JS/CSS/images (ETag revalidation returns 304 after that)
+    STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', 3600))
+    SEND_FILE_MAX_AGE_DEFAULT = STATIC_MAX_AGE  # any bare send_from_directory/send_file
+
+    # Static offload to a fronting web server (off by default - Render talks to gunicorn directly).
+    # USE_X_SENDFILE=true: file responses go out as an empty body + X-Sendfile: <absolute path>
+    # (Apache mod_xsendfile, lighttpd). Behind nginx also set X_ACCEL_REDIRECT_PREFIX to an
+    # `internal;` location aliased to the app root, e.g. /_internal/ -> alias /app/;
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
+    X_ACCEL_REDIRECT_PREFIX = os.getenv('X_ACCEL_REDIRECT_PREFIX', '')
+
+    # CORS only where cross-origin XHR can happen (the JSON API); browsers cache preflights for a day
+    CORS_ORIGINS = [o.strip() for o in os.getenv('CORS_ORIGINS', '*').split(',') if o.strip()]
+    CORS_PREFLIGHT_MAX_AGE = 86400
+
+    # Response compression (flask-compress) - text payloads only; SSE and .xlsx are left alone
+    COMPRESS_MIMETYPES = ['text/html', 'text/css', 'application/javascript', 'text/javascript', 'application/json']
+    COMPRESS_LEVEL = 6
+    COMPRESS_MIN_SIZE = 500
 
 # Create Flask app
-app = Flask(__name__)
+# No static/ folder - pages and /shared assets go through _send_static, so skip Flask's dead /static route
+app = Flask(__name__, static_folder=None)
 app.config.from_object(Config)
-CORS(app)
+CORS(app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS, "max_age": Config.CORS_PREFLIGHT_MAX_AGE}})
+
+# Negotiate gzip/br for HTML/CSS/JS/JSON via Accept-Encoding (optional dependency)
+try:
+    from flask_compress import Compress
+    Compress(app)
+    logger.info("Response compression enabled (flask-compress)")
+except ImportError:
+    logger.warning("flask-compress not installed - responses will be sent uncompressed")
+
+# orjson (C encoder) behind app.json - jsonify(), request.get_json() and friends all use it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    logger.warning("orjson not installed - JSON responses will use the stdlib encoder")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Keeps Flask's semantics: dates/decimals still go through the default hook
+    (HTTP dates, not ISO), keys are sorted, and debug mode pretty-prints.
+    Anything orjson rejects (e.g. ints beyond 64 bits) falls back to the
+    stdlib encoder.
+    """
+
+    def _options(self, sort_keys):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs):
+        option = self._options(kwargs.get('sort_keys', self.sort_keys))
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        """
+        jsonify() fast path: orjson's bytes (newline appended by orjson) go
+        straight into the Response - no decode to str and re-encode, which
+        is most of the cost left on large result payloads.
+        """
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)  # pretty-printed
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options(self.sort_keys) | orjson.OPT_APPEND_NEWLINE
+        try:
+            body = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 # ============================================================================
 # MODULE RELOAD DETECTION
 # ============================================================================
 # Track module reloads to diagnose session disappearance issue
-import uuid
-import time
-
 MODULE_LOAD_ID = str(uuid.uuid4())[:8]
 MODULE_LOAD_TIME = time.time()
 logger.info("="*80)
-logger.info(f"🔄 MODULE LOADED: ID={MODULE_LOAD_ID}, PID={os.getpid()}, TIME={datetime.now().isoformat()}")
+logger.info("🔄 MODULE LOADED: ID=%s, PID=%s, TIME=%s", MODULE_LOAD_ID, os.getpid(), datetime.now().isoformat())
 logger.info("="*80)
 
 # Global state
-progress_queues = {}  # session_id -> Queue for SSE progress (legacy)
-session_events = {}  # session_id -> [events] for polling (NEW)
-analysis_threads = {}  # session_id -> Thread for cancellation
-analysis_results = {}  # session_id -> result data (legacy, kept for backward compatibility)
-active_analyses = {}  # session_id -> {'orchestrator': HotdogOrchestrator, 'config_path': str, 'pdf_path': str, 'status': 'running'} (in-progress)
-completed_analyses = {}  # session_id -> {'orchestrator': ..., 'result': ..., 'config_path': ..., 'completed_at': datetime, 'status': 'completed'}
-partial_analyses = {}  # session_id -> {'orchestrator': ..., 'config_path': ..., 'stopped_at': datetime, 'status': 'stopped'}
-session_timestamps = {}  # session_id -> last_access_time (for cleanup)
 
-logger.info(f"📊 Session dicts initialized: module_id={MODULE_LOAD_ID}, pid={os.getpid()}")
+# Polling keeps the newest EVENT_LOG_SIZE events per session; indices keep
+# counting past it, so a client that fell that far behind just skips ahead
+EVENT_LOG_SIZE = 10_000
+
+# SSE buffer per session; when a stalled stream lets it fill, the oldest
+# progress events fall off (the polling log above still has them)
+PROGRESS_QUEUE_SIZE = 1000
+
+
+@dataclass(slots=True)
+class SessionState:
+    """
+    Per-analysis streaming state. One record per session_id instead of
+    parallel queue/events/thread/timestamp dicts, so the SSE, polling and
+    callback paths each do a single lookup. Slotted (like AnalysisRecord):
+    no per-instance __dict__, and fields are fixed-offset descriptors.
+    """
+    progress_queue: deque = field(default_factory=lambda: deque(maxlen=PROGRESS_QUEUE_SIZE))  # SSE (legacy)
+    progress_ready: threading.Event = field(default_factory=threading.Event, repr=False)  # wakes the SSE reader
+    events: deque = field(default_factory=lambda: deque(maxlen=EVENT_LOG_SIZE))  # polling (primary)
+    event_count: int = 0  # events ever added; events[0] has index event_count - len(events)
+    thread: Optional[threading.Thread] = None  # for cancellation
+    last_access: float = field(default_factory=time.monotonic)  # monotonic seconds, for cleanup
+    events_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def push_progress(self, item):
+        """Queue an (event_type, SSE frame bytes) pair for the stream and wake its reader."""
+        self.progress_queue.append(item)  # deque append is atomic - no queue mutex
+        self.progress_ready.set()
+
+    def add_event(self, event):
+        with self.events_lock:
+            self.events.append(event)
+            self.event_count += 1
+
+    def events_since(self, index):
+        """(events from `index` on, next index to poll with) - copies only the new tail."""
+        with self.events_lock:
+            new = self.event_count - max(index, self.event_count - len(self.events))
+            if new <= 0:
+                return [], self.event_count
+            tail = list(itertools.islice(reversed(self.events), new))
+            tail.reverse()
+            return tail, self.event_count
+
+    def release_stream(self):
+        """Drop buffered events/queue but keep the record (and its timestamp)."""
+        self.progress_queue = deque(maxlen=PROGRESS_QUEUE_SIZE)
+        self.progress_ready = threading.Event()
+        with self.events_lock:
+            self.events = deque(maxlen=EVENT_LOG_SIZE)  # event_count stays: indices never go back
+        self.thread = None
+
+
+@dataclass(slots=True)
+class AnalysisRecord:
+    """
+    One analysis, whatever stage it is in. Replaces the separate active /
+    completed / partial / legacy-results dicts: a session moves between
+    stages by changing `status` under session_lock, so every reader does a
+    single lookup and never sees it in two places (or none) mid-move.
+    """
+    status: str  # 'active' -> 'completed' | 'partial' (stopped by user)
+    orchestrator: object
+    config_path: str
+    pdf_path: str = ''
+    pdf_filename: str = 'Unknown.pdf'
+    result: object = None  # AnalysisResult once completed
+    started_at: datetime = field(default_factory=datetime.now)
+    completed_at: Optional[datetime] = None
+    stopped_at: Optional[datetime] = None
+    error: Optional[str] = None
+    legacy_payload: Optional[tuple] = None  # (legacy_result, statistics), see _completed_payload
+    partial_payload: Optional[tuple] = None  # stopped analyses only, see _partial_payload
+    summary: Optional[dict] = None  # admin view for the current status, see _session_summary
+
+
+# session_id -> SessionState, least recently touched first (see _touch_session),
+# so cleanup pops stale sessions off the front instead of scanning them all
+analysis_sessions = OrderedDict()
+analyses = {}  # session_id -> AnalysisRecord
+
+logger.info("📊 Session dicts initialized: module_id=%s, pid=%s", MODULE_LOAD_ID, os.getpid())
 
 # ============================================================================
 # THREAD SAFETY
@@ -104,7 +310,56 @@ logger.info(f"📊 Session dicts initialized: module_id={MODULE_LOAD_ID}, pid={o
 session_lock = threading.Lock()
 logger.info("🔒 Session lock initialized for thread-safe dict access")
 
+
+def _session_state(session_id):
+    """
+    SessionState for session_id, created on first use (no throwaway Queue when it exists).
+    Caller holds session_lock: analysis_sessions' order is what cleanup walks.
+    """
+    state = analysis_sessions.get(session_id)
+    if state is None:
+        state = analysis_sessions.setdefault(session_id, SessionState())
+    return state
+
+
+def _touch_session(session_id):
+    """
+    Stamp the session as used now and move it to the fresh end of analysis_sessions.
+    Caller holds session_lock - a reorder during cleanup's walk would abort it.
+    """
+    state = _session_state(session_id)
+    state.last_access = time.monotonic()
+    try:
+        analysis_sessions.move_to_end(session_id)
+    except KeyError:
+        pass  # cleanup dropped it in between; the caller still holds the state
+    return state
+
 # Authentication - Load from environment variables
+# Passwords are stored as scrypt (memory-hard, stdlib) over the raw SHA-256
+# digest, with a per-user salt. Hashing happens once here; each login pays
+# one scrypt, and /api/verify-session only ever touches the token store.
+PASSWORD_SCRYPT_PARAMS = {'n': 2 ** 14, 'r': 8, 'p': 1, 'dklen': 32}
+
+
+def _password_digest(password):
+    """Raw 32-byte SHA-256 of the submitted password (no hex round trip)."""
+    return hashlib.sha256(password.encode('utf-8')).digest()
+
+
+def _hash_password(password_digest, salt):
+    """scrypt over the password's raw SHA-256 digest (raw bytes out)."""
+    return hashlib.scrypt(password_digest, salt=salt, **PASSWORD_SCRYPT_PARAMS)
+
+
+def _new_password_record(password):
+    salt = secrets.token_bytes(16)
+    return {
+        'password_salt': salt,
+        'password_hash': _hash_password(_password_digest(password), salt)
+    }
+
+
 def load_authorized_users():
     """Load authorized users from environment variables for security."""
     users = {}
@@ -116,7 +371,7 @@ def load_authorized_users():
 
     if user1_email and user1_password:
         users[user1_email.lower()] = {  # Lowercase for case-insensitive matching
-            'password_hash': hashlib.sha256(user1_password.encode()).hexdigest(),
+            **_new_password_record(user1_password),
             'name': user1_name,
             'role': 'admin'  # Full admin access
         }
@@ -128,7 +383,7 @@ def load_authorized_users():
 
     if user2_email and user2_password:
         users[user2_email.lower()] = {  # Lowercase for case-insensitive matching
-            'password_hash': hashlib.sha256(user2_password.encode()).hexdigest(),
+            **_new_password_record(user2_password),
             'name': user2_name,
             'role': 'user'  # Basic user access only
         }
@@ -139,13 +394,14 @@ def load_authorized_users():
     return users
 
 AUTHORIZED_USERS = load_authorized_users()
-active_sessions = {}
+# Login tokens: Redis (shared by every worker, TTL-expired) when REDIS_URL is set, else in-process
+active_sessions = create_session_store(os.getenv('REDIS_URL'))
 
 # Log loaded users on startup
 logger.info("="*60)
 logger.info("AUTHORIZED USERS LOADED:")
 for email, data in AUTHORIZED_USERS.items():
-    logger.info(f"  User: {email} | Name: {data.get('name', 'N/A')} | Role: {data.get('role', 'N/A')}")
+    logger.info("  User: %s | Name: %s | Role: %s", email, data.get('name', 'N/A'), data.get('role', 'N/A'))
 logger.info("="*60)
 
 
@@ -154,13 +410,7 @@ def check_auth_cookie():
     from flask import request
     # Check cookie (authToken - camelCase to match frontend), then Authorization header
     token = request.cookies.get('authToken') or request.headers.get('Authorization', '').replace('Bearer ', '')
-    if not token or token not in active_sessions:
-        return None
-    session = active_sessions[token]
-    if datetime.now() > session['expires_at']:
-        del active_sessions[token]
-        return None
-    return session
+    return active_sessions.get(token)
 
 
 def require_admin(f):
@@ -176,13 +426,11 @@ def require_admin(f):
             if request.is_json:
                 data = request.get_json(silent=True)
                 if data and 'token' in data:
-                    token = data['token']
-                    if token in active_sessions:
-                        session = active_sessions[token]
+                    session = active_sessions.get(data['token'])
         if not session:
             return redirect('/')
         if session.get('role') != 'admin':
-            logger.warning(f"Non-admin user {session.get('username')} attempted to access admin route")
+            logger.warning("Non-admin user %s attempted to access admin route", session.get('username'))
             return redirect('/')
         return f(*args, **kwargs)
     return decorated_function
@@ -192,11 +440,34 @@ def require_admin(f):
 # SESSION CLEANUP (Memory Management)
 # ============================================================================
 
+# Idle time after which a session's data is eligible for cleanup
+SESSION_RETENTION_SECONDS = 30 * 24 * 60 * 60  # 30 days
+# Idle time after which a finished session's progress buffers are released
+# (nobody streams or polls progress an hour after the analysis ended)
+STREAM_RETENTION_SECONDS = 60 * 60
+CLEANUP_INTERVAL_SECONDS = 15 * 60
+
+
+def _schedule_cleanup():
+    """
+    Queue the next cleanup pass. Under the gevent worker that is a timer on
+    the hub (no OS thread per pass); otherwise a daemon threading.Timer.
+    """
+    if GEVENT_WORKER:
+        import gevent
+        gevent.spawn_later(CLEANUP_INTERVAL_SECONDS, cleanup_expired_sessions)
+    else:
+        timer = threading.Timer(CLEANUP_INTERVAL_SECONDS, cleanup_expired_sessions)
+        timer.daemon = True
+        timer.start()
+
+
 def cleanup_expired_sessions():
     """
     Remove TEMPORARY session data older than 30 days.
     KEEPS completed/partial analyses for 30 days.
-    Reschedules itself every 15 minutes using threading.Timer.
+    Releases progress buffers of finished sessions idle for an hour.
+    Reschedules itself every 15 minutes (see _schedule_cleanup).
 
     THREAD SAFETY: Uses session_lock to prevent race conditions with
     concurrent admin requests and analysis completion.
@@ -205,44 +476,246 @@ def cleanup_expired_sessions():
         # CRITICAL: Atomic cleanup with lock
         # Prevents race with admin endpoint and analysis threads
         with session_lock:
-            cutoff = datetime.now() - timedelta(days=30)
-            expired = [
-                sid for sid, ts in session_timestamps.items()
-                if ts < cutoff
-            ]
-
-            for sid in expired:
-                # Clean up temporary/transient data (safe to delete)
-                progress_queues.pop(sid, None)
-                session_events.pop(sid, None)
-                analysis_threads.pop(sid, None)
-
-                # ONLY delete if not in completed/partial (preserve valuable analysis results)
-                if sid not in completed_analyses and sid not in partial_analyses:
-                    analysis_results.pop(sid, None)
-                    active_analyses.pop(sid, None)
-                    session_timestamps.pop(sid, None)
-                    logger.info(f"✅ Cleaned up expired session: {sid}")
+            now = time.monotonic()
+            cutoff = now - SESSION_RETENTION_SECONDS
+            # Oldest first: stop at the first session touched within the hour,
+            # so a sweep only visits idle sessions, never the busy tail
+            idle = list(itertools.takewhile(
+                lambda item: item[1].last_access < now - STREAM_RETENTION_SECONDS,
+                analysis_sessions.items()
+            ))
+            expired = []
+            released = 0
+            for sid, state in idle:
+                if state.last_access >= cutoff:
+                    # Idle over an hour: drop a finished analysis's event log
+                    # and SSE buffer, keep the session itself
+                    if state.events or state.progress_queue:
+                        record = analyses.get(sid)
+                        if record is not None and record.status != 'active':
+                            state.release_stream()
+                            released += 1
+                    continue
+                expired.append(sid)
+
+                # ONLY delete if not completed/partial (preserve valuable analysis results)
+                record = analyses.get(sid)
+                if record is None or record.status == 'active':
+                    analyses.pop(sid, None)
+                    analysis_sessions.pop(sid, None)
+                    logger.info("✅ Cleaned up expired session: %s", sid)
                 else:
-                    logger.info(f"⏳ Keeping completed/partial session: {sid}")
+                    # Clean up temporary/transient data (safe to delete), then
+                    # requeue it at the back so later sweeps start past it
+                    state.release_stream()
+                    state.last_access = time.monotonic()
+                    analysis_sessions.move_to_end(sid)
+                    logger.info("⏳ Keeping completed/partial session: %s", sid)
 
         # Log outside lock
         if expired:
-            logger.info(f"🧹 Cleaned up {len(expired)} expired sessions")
+            logger.info("🧹 Cleaned up %s expired sessions", len(expired))
+        if released:
+            logger.info("🧹 Released progress buffers of %s idle finished sessions", released)
+
+        # Expired login tokens (no-op for Redis, which expires them itself)
+        expired_tokens = active_sessions.sweep()
+        if expired_tokens:
+            logger.info("🧹 Dropped %s expired auth tokens", expired_tokens)
 
     except Exception as e:
-        logger.error(f"❌ Session cleanup failed: {e}")
+        logger.error("❌ Session cleanup failed: %s", e)
+
+    # Reschedule cleanup in 15 minutes
+    _schedule_cleanup()
+
+
+_cleanup_scheduler_pid = None
+
+
+def start_cleanup_scheduler():
+    """Start the cleanup timer once per process (safe to call again after fork)."""
+    global _cleanup_scheduler_pid
+    if _cleanup_scheduler_pid == os.getpid():
+        return
+    _cleanup_scheduler_pid = os.getpid()
+    cleanup_expired_sessions()
+    logger.info("🧹 Session cleanup scheduler started (15-minute intervals)")
+
+
+_analysis_loop = None
+_analysis_loop_pid = None
+_analysis_loop_lock = threading.Lock()
+
+
+def _get_analysis_loop():
+    """One asyncio loop per process for every analysis, run on a daemon thread.
+
+    Started on first use (and again after fork - threads don't survive it), so a
+    preloading gunicorn master never owns it.
+    """
+    global _analysis_loop, _analysis_loop_pid
+    with _analysis_loop_lock:
+        if _analysis_loop_pid != os.getpid():
+            _analysis_loop = asyncio.new_event_loop()
+            threading.Thread(target=_analysis_loop.run_forever,
+                             name='analysis-loop', daemon=True).start()
+            _analysis_loop_pid = os.getpid()
+        return _analysis_loop
+
+
+# At most EXCEL_EXPORT_WORKERS Excel exports build at once per process:
+# openpyxl is CPU-bound, so a burst of exports would otherwise starve every
+# other request thread of the GIL
+EXCEL_EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+EXCEL_EXPORT_TIMEOUT_SECONDS = 120
+
+_export_slots = threading.BoundedSemaphore(EXCEL_EXPORT_WORKERS)
+_export_pool = None
+_export_pool_pid = None
+_export_pool_lock = threading.Lock()
+
+
+def _get_gevent_export_pool():
+    """gevent ThreadPool for this worker (created lazily, and again after fork)."""
+    global _export_pool, _export_pool_pid
+    with _export_pool_lock:
+        if _export_pool_pid != os.getpid():
+            from gevent.threadpool import ThreadPool
+            _export_pool = ThreadPool(EXCEL_EXPORT_WORKERS)
+            _export_pool_pid = os.getpid()
+        return _export_pool
+
+
+def _run_export(fn):
+    """
+    Run the blocking export fn() with bounded concurrency; raises TimeoutError
+    after EXCEL_EXPORT_TIMEOUT_SECONDS.
+
+    Under the gevent worker it runs on a real OS thread from a small pool and
+    the request greenlet waits cooperatively, so the hub keeps serving. On
+    threaded workers the request thread is the natural place to run it - it
+    would only sit waiting otherwise - so it just takes one of the slots.
+    """
+    if GEVENT_WORKER:
+        import gevent
+        try:
+            return _get_gevent_export_pool().spawn(fn).get(timeout=EXCEL_EXPORT_TIMEOUT_SECONDS)
+        except gevent.Timeout:
+            raise TimeoutError('Excel export timed out')
 
-    # Reschedule cleanup in 15 minutes (900 seconds)
-    timer = threading.Timer(900, cleanup_expired_sessions)
-    timer.daemon = True
-    timer.start()
+    if not _export_slots.acquire(timeout=EXCEL_EXPORT_TIMEOUT_SECONDS):
+        raise TimeoutError('Excel export queue is full')
+    try:
+        return fn()
+    finally:
+        _export_slots.release()
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def _json_bytes(payload):
+    """Encode a constant JSON body once (same compact form jsonify produces)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, separators=(',', ':'), sort_keys=True) + '\n').encode('utf-8')
+
+
+def _sse_message(payload):
+    """One Server-Sent Events `data:` frame as bytes (orjson when installed)."""
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode('utf-8')
+    return b'data: ' + body + b'\n\n'
+
+
+SSE_KEEPALIVE = b': keepalive\n\n'
+SSE_DONE = _sse_message({'event': 'done'})
+
+
+def _json_response(body, status=200):
+    """Fresh Response around a pre-encoded body (after_request hooks mutate headers)."""
+    return Response(body, status=status, mimetype='application/json')
+
+
+@functools.lru_cache(maxsize=64)
+def _error_body(message):
+    """Pre-encoded {'success': False, 'error': message} - each constant message is encoded once."""
+    return _json_bytes({'success': False, 'error': message})
+
+
+def _json_error(message, status):
+    """Error response for a constant message (never pass user- or exception-derived text)."""
+    return _json_response(_error_body(message), status)
+
+
+def _file_mtime(path):
+    """File modification time as an aware UTC datetime (whole seconds, as HTTP dates are)."""
+    try:
+        return datetime.fromtimestamp(int(path.stat().st_mtime), tz=timezone.utc)
+    except OSError:
+        return None
+
+
+def _send_static(directory, filename):
+    """
+    Serve a static file with browser caching enabled.
+
+    Emits Cache-Control: public, max-age plus ETag/Last-Modified, and answers
+    If-None-Match / If-Modified-Since with a body-less 304 Not Modified.
+    With USE_X_SENDFILE the front server streams the bytes (see Config).
+    """
+    response = send_from_directory(
+        directory,
+        filename,
+        max_age=Config.STATIC_MAX_AGE,
+        etag=True,
+        conditional=True
+    )
+    if Config.X_ACCEL_REDIRECT_PREFIX:
+        sendfile_path = response.headers.pop('X-Sendfile', None)
+        if sendfile_path:
+            relative = os.path.relpath(sendfile_path, Config.BASE_DIR_STR)
+            response.headers['X-Accel-Redirect'] = Config.X_ACCEL_REDIRECT_PREFIX + quote(relative)
+    return response
+
+
+@functools.lru_cache(maxsize=32)
+def _parsed_config_for(config_path, mtime_ns):
+    from services.hotdog.layers import ConfigurationLoader
+    return ConfigurationLoader().load_from_json(config_path)
+
+
+def _load_parsed_config(config_path):
+    """
+    Parsed question config, re-read only when the file changes (keyed by
+    path + mtime). Callers only read it - don't mutate the returned object.
+    """
+    return _parsed_config_for(config_path, os.stat(config_path).st_mtime_ns)
+
+
+def _completed_payload(record):
+    """
+    (legacy_result, statistics) for a finished analysis, built on first use
+    and kept on the record - the result can no longer change.
+    """
+    cached = record.legacy_payload
+    if cached is None:
+        result = record.result
+        parsed_config = _load_parsed_config(record.config_path)
+        browser_output = record.orchestrator.get_browser_output(result, parsed_config)
+        cached = (_transform_to_legacy_format(browser_output), {
+            'processing_time': result.processing_time_seconds,
+            'total_tokens': result.total_tokens,
+            'estimated_cost': f"${result.estimated_cost:.4f}",
+            'questions_answered': result.questions_answered,
+            'total_questions': parsed_config.total_questions,
+            'average_confidence': f"{result.average_confidence:.0%}"
+        })
+        record.legacy_payload = cached
+    return cached
+
+
 def _transform_to_legacy_format(hotdog_output: dict) -> dict:
     """
     Transform HOTDOG's modern output format to legacy frontend format.
@@ -271,77 +744,332 @@ def _transform_to_legacy_format(hotdog_output: dict) -> dict:
             }]
         }
     """
-    legacy_sections = []
-
-    for section in hotdog_output.get('sections', []):
-        legacy_section = {
-            'section_name': section.get('section_name', ''),
-            'section_id': section.get('section_id', ''),
-            'description': section.get('description', ''),
-            'questions': []
-        }
+    get = hotdog_output.get
+    return {
+        'sections': [_legacy_section(section) for section in get('sections') or ()],
+        'document_name': get('document_name', ''),
+        'total_pages': get('total_pages', 0),
+        'questions_answered': get('questions_answered', 0),
+        'total_questions': get('total_questions', 0),
+        'metadata': get('metadata', {})
+    }
 
-        for q in section.get('questions', []):
-            legacy_question = {
-                'question_id': q.get('question_id', ''),
-                'question': q.get('question_text', ''),  # Transform: question_text → question
-            }
-
-            # Transform: primary_answer{text, pages, footnote} → answer, page_citations, footnote
-            primary_answer = q.get('primary_answer')
-            # Check if answer exists: either has_answer=True OR primary_answer is not None
-            has_answer = q.get('has_answer', primary_answer is not None)
-            if primary_answer and has_answer:
-                legacy_question['answer'] = primary_answer.get('text', '')
-                legacy_question['page_citations'] = primary_answer.get('pages', [])
-                legacy_question['confidence'] = primary_answer.get('confidence', 0.0)
-                legacy_question['footnote'] = primary_answer.get('footnote', '')  # Include footnote
-            else:
-                legacy_question['answer'] = None
-                legacy_question['page_citations'] = []
-                legacy_question['confidence'] = 0.0
-                legacy_question['footnote'] = None
 
-            legacy_section['questions'].append(legacy_question)
+def _legacy_section(section: dict) -> dict:
+    get = section.get
+    return {
+        'section_name': get('section_name', ''),
+        'section_id': get('section_id', ''),
+        'description': get('description', ''),
+        'questions': [_legacy_question(q) for q in get('questions') or ()]
+    }
+
 
-        legacy_sections.append(legacy_section)
+def _legacy_question(q: dict) -> dict:
+    """One HOTDOG question -> legacy {question, answer, page_citations, ...} (one dict literal)."""
+    get = q.get
+    # Transform: primary_answer{text, pages, footnote} → answer, page_citations, footnote
+    primary_answer = get('primary_answer')
+    # Check if answer exists: either has_answer=True OR primary_answer is not None
+    if primary_answer and get('has_answer', True):
+        answer_get = primary_answer.get
+        return {
+            'question_id': get('question_id', ''),
+            'question': get('question_text', ''),  # Transform: question_text → question
+            'answer': answer_get('text', ''),
+            'page_citations': answer_get('pages', []),
+            'confidence': answer_get('confidence', 0.0),
+            'footnote': answer_get('footnote', '')  # Include footnote
+        }
+    return {
+        'question_id': get('question_id', ''),
+        'question': get('question_text', ''),
+        'answer': None,
+        'page_citations': [],
+        'confidence': 0.0,
+        'footnote': None
+    }
 
+
+def _partial_legacy_result(accumulated_answers: dict, parsed_config) -> dict:
+    """
+    Legacy-format result for answers accumulated so far, read straight off the
+    typed config (Section/Question) and Answer objects.
+
+    Same output as orchestrator._build_partial_browser_output followed by
+    _transform_to_legacy_format, minus the intermediate browser dicts that
+    were only built to be re-read key by key. Polled while analyses run.
+    """
+    get_answers = accumulated_answers.get
+    sections = []
+    for section in parsed_config.sections:
+        questions = []
+        for question in section.questions:
+            answers = get_answers(question.id)
+            if answers:
+                primary = answers[0]
+                questions.append({
+                    'question_id': question.id,
+                    'question': question.text,
+                    'answer': primary.text,
+                    'page_citations': primary.pages,
+                    'confidence': primary.confidence,
+                    'footnote': primary.footnote
+                })
+            else:
+                questions.append({
+                    'question_id': question.id,
+                    'question': question.text,
+                    'answer': None,
+                    'page_citations': [],
+                    'confidence': 0.0,
+                    'footnote': None
+                })
+        sections.append({
+            'section_name': section.name,
+            'section_id': section.id,
+            'description': section.description,
+            'questions': questions
+        })
+    # Partial output has no document-level fields yet (the transform's defaults)
     return {
-        'sections': legacy_sections,
-        'document_name': hotdog_output.get('document_name', ''),
-        'total_pages': hotdog_output.get('total_pages', 0),
-        'questions_answered': hotdog_output.get('questions_answered', 0),
-        'total_questions': hotdog_output.get('total_questions', 0),
-        'metadata': hotdog_output.get('metadata', {})
+        'sections': sections,
+        'document_name': '',
+        'total_pages': 0,
+        'questions_answered': 0,
+        'total_questions': 0,
+        'metadata': {}
     }
 
 
+def _copy_upload_stream(stream, dest):
+    """
+    Copy an uploaded file stream into an open binary file, hashing as it goes.
+
+    Returns the SHA-256 hex digest. The extraction cache is keyed on it, so
+    computing it here (one pass in 1MiB reads) spares the analysis thread a
+    second full read of the file later. Plain read(), not readinto(): Werkzeug's
+    LimitedStream.readinto resizes the caller's buffer on its last short read.
+    """
+    digest = hashlib.sha256()
+    while True:
+        chunk = stream.read(Config.UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return digest.hexdigest()
+        digest.update(chunk)
+        dest.write(chunk)
+
+
+def _create_upload_dir(parent=None):
+    """Private scratch directory for uploads under `parent` (None = system temp dir), removed when this process exits."""
+    try:
+        path = tempfile.mkdtemp(prefix='pm-tools-uploads-', dir=parent)
+    except OSError as e:
+        if parent is None:
+            raise
+        logger.warning("Upload dir %s unusable (%s), using system temp dir", parent, e)
+        path = tempfile.mkdtemp(prefix='pm-tools-uploads-')
+    owner_pid = os.getpid()
+
+    def _remove():
+        # Forked gunicorn workers inherit atexit hooks - only the creating process cleans up
+        if os.getpid() == owner_pid:
+            shutil.rmtree(path, ignore_errors=True)
+
+    atexit.register(_remove)
+    return path
+
+
+UPLOAD_DIR = _create_upload_dir(Config.UPLOAD_TMP_DIR)
+# Overflow for an explicit UPLOAD_TMP_DIR - also private, so it's cleaned up the same way
+UPLOAD_SPILL_DIR = _create_upload_dir() if Config.UPLOAD_TMP_DIR else UPLOAD_DIR
+
+
+def _upload_dir_for(size):
+    """
+    Pick where an upload of `size` bytes should go.
+
+    The default scratch dir is on disk and always used. An explicit
+    UPLOAD_TMP_DIR may be a small tmpfs (Docker's /dev/shm defaults to 64MB),
+    so an upload that wouldn't leave UPLOAD_TMP_HEADROOM free there goes to
+    UPLOAD_SPILL_DIR on the system temp dir instead.
+    """
+    if UPLOAD_SPILL_DIR == UPLOAD_DIR:
+        return UPLOAD_DIR
+    try:
+        st = os.statvfs(UPLOAD_DIR)
+    except (AttributeError, OSError):
+        return UPLOAD_SPILL_DIR
+    if st.f_bavail * st.f_frsize >= size + Config.UPLOAD_TMP_HEADROOM:
+        return UPLOAD_DIR
+    return UPLOAD_SPILL_DIR
+
+
+def _advise_sequential(fd):
+    """Hint sequential access so readahead is aggressive when extraction reads the file back."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # advisory only (e.g. unsupported filesystem)
+
+
 # ============================================================================
 # BASIC ROUTES
 # ============================================================================
 
-@app.route('/')
-def index():
-    return send_from_directory(Config.BASE_DIR, 'index.html')
+# Single-file HTML pages: URL -> (endpoint, directory, file). One table instead of a
+# copy-pasted view per page; endpoint names are kept for url_for compatibility.
+HTML_PAGES = {
+    '/': ('index', Config.BASE_DIR, 'index.html'),
+    # CIPP Analyzer application (REBUILT for HOTDOG AI)
+    '/cipp-analyzer': ('cipp_analyzer', Config.BASE_DIR, 'analyzer_rebuild.html'),
+    # Admin session monitoring page
+    # Note: Page is accessible but relies on obscure URL for basic protection
+    # API endpoint /api/admin/sessions can be protected separately if needed
+    '/admin/sessions': ('admin_sessions', Config.BASE_DIR, 'admin_sessions.html'),
+    # CIPP Production Estimator (Comprehensive - All Penalties/Boosts/Pipe Sizes)
+    '/progress-estimator': ('progress_estimator', Config.PROGRESS_ESTIMATOR_DIR, 'CIPPEstimator_Comprehensive.html'),
+}
+
+
+def _load_html_page(directory, filename):
+    """Read a page once at startup: (body, etag, last_modified), or None if it's missing."""
+    path = Path(directory) / filename
+    try:
+        body = path.read_bytes()
+    except OSError as e:
+        logger.warning("HTML page %s not preloaded (%s) - serving from disk", path, e)
+        return None
+    return body, hashlib.sha1(body).hexdigest(), _file_mtime(path)
+
+
+def _register_html_page(rule, endpoint, directory, filename):
+    """
+    Register a view that serves one HTML file with browser caching.
+
+    Pages only change on deploy, so the bytes are read once and held in
+    memory: no stat/open per request, and a content-hash ETag for 304s.
+    The gzip variant is compressed once here too (flask-compress leaves
+    responses that already carry Content-Encoding alone), so a page hit
+    never runs the compressor. The debug server reads from disk so edits
+    show up immediately.
+    """
+    page = _load_html_page(directory, filename)
+    if page is not None:
+        body, etag, last_modified = page
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        # Header values formatted once here instead of via the property setters per request
+        headers = {
+            'ETag': quote_etag(etag),
+            'Last-Modified': http_date(last_modified),
+            'Cache-Control': f'public, max-age={Config.STATIC_MAX_AGE}',
+            'Vary': 'Accept-Encoding'
+        }
+        gzip_headers = {**headers, 'ETag': quote_etag(f'{etag}:gzip'), 'Content-Encoding': 'gzip'}
+
+    def view():
+        if page is None or app.debug:
+            return _send_static(directory, filename)
+        if request.accept_encodings['gzip'] > 0:
+            return Response(gzipped, mimetype='text/html', headers=gzip_headers).make_conditional(request)
+        return Response(body, mimetype='text/html', headers=headers).make_conditional(request)
+
+    view.__name__ = endpoint
+    view.__doc__ = f"Serve {filename}"
+    app.add_url_rule(rule, endpoint, view)
+
+
+for _rule, (_endpoint, _directory, _filename) in HTML_PAGES.items():
+    _register_html_page(_rule, _endpoint, _directory, _filename)
+
+# Shared files up to this size are held in memory; bigger ones (the background
+# photos) stay on disk, where gunicorn streams them with sendfile(2)
+SHARED_CACHE_MAX_BYTES = 256 * 1024
+
+
+def _load_shared_assets(root):
+    """
+    Read the small /shared files once at startup: relpath -> (body, mimetype,
+    headers, gzip variant or None). Same idea as _register_html_page - no
+    stat/open per hit and a content-hash ETag - with the gzip variant built
+    only for the types flask-compress would compress anyway.
+    """
+    assets = {}
+    root = Path(root)
+    for path in root.rglob('*'):
+        try:
+            if not path.is_file() or path.stat().st_size > SHARED_CACHE_MAX_BYTES:
+                continue
+            body = path.read_bytes()
+        except OSError as e:
+            logger.warning("Shared asset %s not preloaded (%s) - serving from disk", path, e)
+            continue
+        mimetype = mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+        etag = hashlib.sha1(body).hexdigest()
+        headers = {
+            'ETag': quote_etag(etag),
+            'Last-Modified': http_date(_file_mtime(path)),
+            'Cache-Control': f'public, max-age={Config.STATIC_MAX_AGE}'
+        }
+        gzipped = None
+        if mimetype in Config.COMPRESS_MIMETYPES and len(body) >= Config.COMPRESS_MIN_SIZE:
+            headers['Vary'] = 'Accept-Encoding'
+            gzipped = (gzip.compress(body, compresslevel=9, mtime=0),
+                       {**headers, 'ETag': quote_etag(f'{etag}:gzip'), 'Content-Encoding': 'gzip'})
+        assets[path.relative_to(root).as_posix()] = (body, mimetype, headers, gzipped)
+    return assets
+
+
+SHARED_ASSETS = _load_shared_assets(Config.SHARED_DIR)
+
 
 @app.route('/shared/<path:filename>')
 def serve_shared_assets(filename):
     """Serve shared assets (images, CSS, etc.)"""
-    return send_from_directory(Config.BASE_DIR / 'shared', filename)
+    asset = None if app.debug else SHARED_ASSETS.get(filename)
+    if asset is None:
+        return _send_static(Config.SHARED_DIR_STR, filename)
+    body, mimetype, headers, gzipped = asset
+    if gzipped is not None and request.accept_encodings['gzip'] > 0:
+        body, headers = gzipped
+    return Response(body, mimetype=mimetype, headers=headers).make_conditional(request)
+
+# Static payload polled by Render's health checker - serialized once at import
+HEALTH_BODY = _json_bytes({
+    'status': 'healthy',
+    'service': 'PM Tools Suite',
+    'version': '2.0.0-clean'
+})
 
 @app.route('/health')
 def health():
-    return jsonify({
-        'status': 'healthy',
-        'service': 'PM Tools Suite',
-        'version': '2.0.0-clean'
-    })
+    """Health check endpoint for Render monitoring"""
+    return _json_response(HEALTH_BODY)
 
 
 # ============================================================================
 # AUTHENTICATION
 # ============================================================================
 
+_DECOY_PASSWORD_RECORD = _new_password_record(secrets.token_urlsafe(16))
+
+
+def _verify_password(username, password_digest):
+    """
+    Check a submitted password digest against the stored scrypt hash.
+
+    Deliberately uncached: every attempt costs one scrypt, so response time
+    says nothing about earlier guesses and no fast hashes of submitted
+    passwords are kept in memory.
+    """
+    # Unknown users still pay for one scrypt + compare against a throwaway record,
+    # so response time doesn't reveal which emails are registered
+    user = AUTHORIZED_USERS.get(username, _DECOY_PASSWORD_RECORD)
+    matches = hmac.compare_digest(_hash_password(password_digest, user['password_salt']), user['password_hash'])
+    return matches and user is not _DECOY_PASSWORD_RECORD
+
+
 @app.route('/api/authenticate', methods=['POST'])
 def authenticate():
     data = request.get_json()
@@ -350,35 +1078,28 @@ def authenticate():
 
     # Simple debug logging
     user_agent = request.headers.get('User-Agent', 'Unknown')
-    logger.info(f"Auth attempt - Username (raw): '{data.get('username', '')}' length={len(data.get('username', ''))}")
-    logger.info(f"Auth attempt - Username (normalized): '{username}' length={len(username)}")
-    logger.info(f"Auth attempt - Password length: {len(password)}")
-    logger.info(f"Auth attempt - User agent: {user_agent[:50]}")
-    logger.info(f"Loaded users in dict: {list(AUTHORIZED_USERS.keys())}")
-
-    if username not in AUTHORIZED_USERS:
-        logger.warning(f"User not found: {username}")
-        return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
-
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    expected_hash = AUTHORIZED_USERS[username]['password_hash']
-
-    if password_hash != expected_hash:
-        logger.warning(f"Password mismatch for {username}")
-        logger.warning(f"  Received hash: {password_hash[:20]}...")
-        logger.warning(f"  Expected hash: {expected_hash[:20]}...")
+    logger.info("Auth attempt - Username (raw): '%s' length=%s", data.get('username', ''), len(data.get('username', '')))
+    logger.info("Auth attempt - Username (normalized): '%s' length=%s", username, len(username))
+    logger.info("Auth attempt - Password length: %s", len(password))
+    logger.info("Auth attempt - User agent: %s", user_agent[:50])
+    logger.info("Loaded users in dict: %s", list(AUTHORIZED_USERS.keys()))
+
+    if not _verify_password(username, _password_digest(password)):
+        if username not in AUTHORIZED_USERS:
+            logger.warning("User not found: %s", username)
+        else:
+            logger.warning("Password mismatch for %s", username)
         return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
 
     token = secrets.token_urlsafe(32)
-    expires_at = datetime.now() + timedelta(hours=24)
     user_role = AUTHORIZED_USERS[username].get('role', 'user')
 
-    active_sessions[token] = {
+    # Expires after 24 hours (store TTL)
+    active_sessions.create(token, {
         'username': username,
         'name': AUTHORIZED_USERS[username]['name'],
-        'role': user_role,
-        'expires_at': expires_at
-    }
+        'role': user_role
+    })
 
     return jsonify({
         'success': True,
@@ -391,12 +1112,8 @@ def verify_session():
     data = request.get_json()
     token = data.get('token', '')
 
-    if token not in active_sessions:
-        return jsonify({'valid': False}), 401
-
-    session = active_sessions[token]
-    if datetime.now() > session['expires_at']:
-        del active_sessions[token]
+    session = active_sessions.get(token)
+    if session is None:
         return jsonify({'valid': False}), 401
 
     return jsonify({'valid': True, 'user': {
@@ -407,25 +1124,12 @@ def verify_session():
 
 
 # ============================================================================
-# API KEY
+# DIAGNOSTICS
 # ============================================================================
 
-@app.route('/api/config/apikey', methods=['GET'])
-def get_api_key():
-    api_key = os.getenv('OPENAI_API_KEY', '')
-    if not api_key:
-        return jsonify({'success': False, 'error': 'API key not configured'}), 500
-
-    return jsonify({
-        'success': True,
-        'key': api_key,
-        'masked': api_key[:10] + '...' + api_key[-4:]
-    })
-
-
-@app.route('/api/health/sse', methods=['GET'])
-def sse_health():
-    """Diagnostic endpoint for SSE environment status"""
+@functools.lru_cache(maxsize=None)
+def _sse_environment():
+    """Interpreter/gevent facts for /api/health/sse - fixed for the process lifetime, probed once."""
     import platform
 
     # Check gevent installation and version
@@ -444,16 +1148,24 @@ def sse_health():
     except ImportError:
         gevent_worker_available = False
 
-    return jsonify({
+    return {
         'python_version': platform.python_version(),
         'python_executable': sys.executable,
         'gevent_installed': gevent_installed,
         'gevent_version': gevent_version,
         'gevent_patched': GEVENT_PATCHED,
         'gevent_worker_available': gevent_worker_available,
-        'server_software': os.environ.get('SERVER_SOFTWARE', 'unknown'),
-        'active_sessions': len(progress_queues),
-        'active_analyses': len(active_analyses)
+        'server_software': os.environ.get('SERVER_SOFTWARE', 'unknown')
+    }
+
+
+@app.route('/api/health/sse', methods=['GET'])
+def sse_health():
+    """Diagnostic endpoint for SSE environment status"""
+    return jsonify({
+        **_sse_environment(),
+        'active_sessions': len(analysis_sessions),
+        'active_analyses': sum(1 for record in list(analyses.values()) if record.status == 'active')
     })
 
 
@@ -461,30 +1173,213 @@ def sse_health():
 # FILE UPLOAD
 # ============================================================================
 
+ALLOWED_UPLOAD_SUFFIXES = ('.pdf',)
+
+
+def _upload_filename_error(filename):
+    return (
+        'No file selected' if not filename else
+        'Only PDF files supported' if not filename.lower().endswith(ALLOWED_UPLOAD_SUFFIXES) else
+        None
+    )
+
+
+# Re-uploads of an identical document hand back the first copy's path instead
+# of storing a second one, and HOTDOG's extraction cache is keyed by the same
+# digest, so a repeat analysis skips parsing too. Upload files are
+# only removed at process exit, so a remembered path stays valid.
+UPLOAD_DEDUP_SIZE = 64
+_uploads_by_hash = OrderedDict()  # sha256 hex -> (path, size)
+_uploads_by_hash_lock = threading.Lock()
+
+
+def _dedupe_upload(temp_path, file_size, content_hash):
+    """Path to keep for this content: an earlier identical upload, or temp_path."""
+    with _uploads_by_hash_lock:
+        known = _uploads_by_hash.get(content_hash)
+        if known is not None and os.path.exists(known[0]) and os.path.getsize(known[0]) == known[1]:
+            _uploads_by_hash.move_to_end(content_hash)
+            duplicate = True
+        else:
+            _uploads_by_hash[content_hash] = (temp_path, file_size)
+            while len(_uploads_by_hash) > UPLOAD_DEDUP_SIZE:
+                _uploads_by_hash.popitem(last=False)
+            duplicate = False
+    if duplicate:
+        os.unlink(temp_path)
+        logger.info("♻️  Duplicate upload (%s) - reusing %s", content_hash[:12], known[0])
+        return known[0]
+    return temp_path
+
+
+def _register_upload(temp_path, file_size, content_hash):
+    """Dedupe a finished upload and record its hash; returns (path, size)."""
+    if not file_size:
+        return temp_path, file_size  # caller rejects empty bodies
+    temp_path = _dedupe_upload(temp_path, file_size, content_hash)
+    from services.hotdog import record_content_hash
+    record_content_hash(temp_path, content_hash)
+    return temp_path, file_size
+
+
+def _store_upload(stream):
+    """Write an upload stream to a temp .pdf and record its hash; returns (path, size)."""
+    # Stream straight into the open handle - no second open by path
+    upload_dir = _upload_dir_for(request.content_length or Config.MAX_CONTENT_LENGTH)
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', mode='wb', dir=upload_dir,
+                                            buffering=Config.UPLOAD_CHUNK_SIZE)
+    temp_path = temp_file.name
+    try:
+        with temp_file:
+            content_hash = _copy_upload_stream(stream, temp_file)
+            _advise_sequential(temp_file.fileno())
+            temp_file.flush()
+            # Size from the open descriptor - no second path lookup after close
+            file_size = os.fstat(temp_file.fileno()).st_size
+    except BaseException:
+        # Disconnect, short body or over-limit chunked body - don't leave the partial file behind
+        os.unlink(temp_path)
+        raise
+    return _register_upload(temp_path, file_size, content_hash)
+
+
+class _HashingUploadFile:
+    """
+    Destination for a multipart file part: a kept temp .pdf in the upload dir
+    that hashes each block as Werkzeug's parser writes it. /api/upload then
+    just claims the file - no spool in Werkzeug's own temp file followed by
+    a second copy into ours.
+    """
+
+    def __init__(self, directory):
+        self._file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', mode='w+b', dir=directory,
+                                                 buffering=Config.UPLOAD_CHUNK_SIZE)
+        self.name = self._file.name
+        self.digest = hashlib.sha256()
+        self.claimed = False
+
+    def write(self, data):
+        self.digest.update(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)  # read/seek/close/... for FileStorage
+
+
+class UploadRequest(Request):
+    """
+    Request whose /api/upload file parts are written straight to the upload dir.
+
+    Every part file is recorded in upload_parts as it is created - a part
+    whose parse never finished (truncated body) is not in request.files, but
+    must still be deleted.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_parts = []
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if self.endpoint == 'upload_file':
+            part = _HashingUploadFile(_upload_dir_for(total_content_length or Config.MAX_CONTENT_LENGTH))
+            self.upload_parts.append(part)
+            return part
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
+
+app.request_class = UploadRequest
+
+
+def _claim_upload_file(upload):
+    """Finish a parser-written upload; returns (path, size) like _store_upload."""
+    upload.claimed = True
+    upload.flush()
+    _advise_sequential(upload.fileno())
+    file_size = os.fstat(upload.fileno()).st_size
+    upload.close()
+    return _register_upload(upload.name, file_size, upload.digest.hexdigest())
+
+
+def _discard_unclaimed_uploads():
+    """Delete parser-written parts the handler didn't keep (extra fields, rejected or truncated files)."""
+    for upload in request.upload_parts:
+        if not upload.claimed:
+            upload.close()
+            try:
+                os.unlink(upload.name)
+            except OSError:
+                pass
+
+TOO_LARGE_BODY = _json_bytes({
+    'success': False,
+    'error': f'File too large (max {Config.MAX_CONTENT_LENGTH // (1024 * 1024)}MB)'
+})
+
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
     """Upload PDF file, save to temp, return filepath"""
-    if 'file' not in request.files:
-        return jsonify({'success': False, 'error': 'No file provided'}), 400
+    # Reject oversized bodies from the header alone - before Werkzeug parses/spools anything
+    if request.content_length is not None and request.content_length > Config.MAX_CONTENT_LENGTH:
+        return _json_response(TOO_LARGE_BODY, 413)
 
-    file = request.files['file']
-    if file.filename == '':
-        return jsonify({'success': False, 'error': 'No file selected'}), 400
+    try:
+        file = request.files.get('file')
+        error = (
+            'No file provided' if file is None else
+            _upload_filename_error(file.filename)
+        )
+        if error:
+            return _json_error(error, 400)
 
-    if not file.filename.lower().endswith('.pdf'):
-        return jsonify({'success': False, 'error': 'Only PDF files supported'}), 400
+        if isinstance(file.stream, _HashingUploadFile):
+            temp_path, file_size = _claim_upload_file(file.stream)
+        else:
+            temp_path, file_size = _store_upload(file.stream)
+    finally:
+        _discard_unclaimed_uploads()
+    if not file_size:
+        os.unlink(temp_path)
+        return _json_error('No file provided', 400)
+    logger.info("File uploaded: %s (%d bytes) -> %s", file.filename, file_size, temp_path)
 
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf', mode='wb') as temp_file:
-        temp_path = temp_file.name
-        file.save(temp_path)
+    return jsonify({
+        'success': True,
+        'filepath': temp_path,
+        'filename': file.filename,
+        'size': file_size
+    })
 
-    logger.info(f"File uploaded: {file.filename} -> {temp_path}")
+
+@app.route('/api/upload/stream', methods=['POST'])
+def upload_file_stream():
+    """
+    Upload PDF as the raw request body (Content-Type: application/pdf, original
+    name URL-encoded in X-Filename). Skips Werkzeug's multipart parser, which
+    scans every line of a large binary body in Python.
+    """
+    if request.content_length is not None and request.content_length > Config.MAX_CONTENT_LENGTH:
+        return _json_response(TOO_LARGE_BODY, 413)
+
+    filename = unquote(request.headers.get('X-Filename', ''))
+    error = _upload_filename_error(filename)
+    if error:
+        return _json_error(error, 400)
+
+    try:
+        temp_path, file_size = _store_upload(request.stream)
+    except ClientDisconnected:
+        logger.warning("Upload stream ended early: %s", filename)
+        return _json_error('Upload incomplete - the connection closed before the whole file arrived', 400)
+    if not file_size:
+        os.unlink(temp_path)
+        return _json_error('No file provided', 400)
+    logger.info("File streamed: %s (%d bytes) -> %s", filename, file_size, temp_path)
 
     return jsonify({
         'success': True,
         'filepath': temp_path,
-        'filename': file.filename
+        'filename': filename,
+        'size': file_size
     })
 
 
@@ -497,63 +1392,61 @@ def progress_stream(session_id):
     """SSE endpoint for real-time progress updates"""
 
     def generate():
-        import time
-
-        # Create or get queue (atomic to prevent race condition)
-        progress_queues.setdefault(session_id, queue.Queue(maxsize=1000))
-        q = progress_queues[session_id]
+        # Create or get the session's queue (under the lock - cleanup walks the dict)
+        with session_lock:
+            state = _session_state(session_id)
+        q, ready = state.progress_queue, state.progress_ready
 
-        # DIAGNOSTIC: Log SSE connection with timestamp
-        start_time = time.time()
-        logger.info(f"🔵 SSE connection opened: {session_id} at {datetime.now().isoformat()}")
+        # DIAGNOSTIC: Log SSE connection (log records carry the wall-clock time;
+        # per-event lines log seconds since open from the monotonic clock)
+        start_time = time.monotonic()
+        logger.info("🔵 SSE connection opened: %s", session_id)
 
         # Send connection event
-        yield f"data: {json.dumps({'event': 'connected', 'session_id': session_id})}\n\n"
-        logger.info(f"📤 Sent 'connected' event to client: {session_id}")
+        yield _sse_message({'event': 'connected', 'session_id': session_id})
+        logger.info("📤 Sent 'connected' event to client: %s", session_id)
 
         # DIAGNOSTIC: Immediate test yield (should appear instantly in browser if no buffering)
         time.sleep(0.5)
-        test_timestamp = time.time()
-        yield f"data: {json.dumps({'event': 'diagnostic_test', 'message': 'Immediate yield test', 'timestamp': test_timestamp})}\n\n"
-        logger.info(f"📤 Sent diagnostic test event: {session_id} (delta: {test_timestamp - start_time:.2f}s)")
+        yield _sse_message({'event': 'diagnostic_test', 'message': 'Immediate yield test', 'timestamp': time.time()})
+        logger.info("📤 Sent diagnostic test event: %s (delta: %.2fs)", session_id, time.monotonic() - start_time)
 
         # Stream events
         while True:
-            try:
-                # Get next event (15 second timeout for keepalive)
-                event_type, data = q.get(timeout=15)
-                logger.info(f"📡 SSE sending: {event_type} at {datetime.now().isoformat()}")  # Changed to INFO
+            if not q:
+                # Wait for the next event (15 second timeout for keepalive)
+                if not ready.wait(timeout=15):
+                    logger.info("💓 SSE keepalive: %s (+%.1fs)", session_id, time.monotonic() - start_time)
+                    yield SSE_KEEPALIVE
+                    continue
+            # Clear before draining: anything pushed after this re-sets the flag
+            ready.clear()
+
+            while q:
+                # Frames were serialized by the producer - nothing to encode here
+                event_type, frame = q.popleft()
+                logger.debug("📡 SSE sending: %s (+%.1fs)", event_type, time.monotonic() - start_time)
+                yield frame
 
                 # Check for done/error signals
                 if event_type == 'done':
-                    logger.info(f"✅ SSE sending 'done' event: {session_id}")
-                    yield f"data: {json.dumps({'event': 'done'})}\n\n"
-                    break
+                    logger.info("✅ SSE sent 'done' event: %s", session_id)
+                    return
 
                 if event_type == 'error':
-                    logger.info(f"❌ SSE sending 'error' event: {session_id}")
-                    yield f"data: {json.dumps({'event': 'error', 'error': data})}\n\n"
-                    break
-
-                # Send progress event
-                yield f"data: {json.dumps({'event': event_type, **data})}\n\n"
-
-            except queue.Empty:
-                # Send keepalive
-                logger.info(f"💓 SSE keepalive: {session_id} at {datetime.now().isoformat()}")  # Changed to INFO
-                yield ": keepalive\n\n"
-
-        # Cleanup
-        if session_id in progress_queues:
-            del progress_queues[session_id]
+                    logger.info("❌ SSE sent 'error' event: %s", session_id)
+                    return
 
+    # Every frame is already bytes: direct_passthrough hands the generator to
+    # the server as-is instead of through Werkzeug's per-chunk encode wrapper
     return Response(
         stream_with_context(generate()),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no'
-        }
+        },
+        direct_passthrough=True
     )
 
 
@@ -566,19 +1459,17 @@ def get_events(session_id):
     """Get new events since last poll (replaces SSE streaming)"""
     last_index = int(request.args.get('last_index', 0))
 
-    # Get events for this session
-    events = session_events.get(session_id, [])
-
     # Return only new events since last_index
-    new_events = events[last_index:]
+    state = analysis_sessions.get(session_id)
+    new_events, total = state.events_since(last_index) if state is not None else ([], 0)
 
-    logger.info(f"📡 Polling: session={session_id}, last_index={last_index}, new_events={len(new_events)}, total={len(events)}")
+    logger.info("📡 Polling: session=%s, last_index=%s, new_events=%s, total=%s", session_id, last_index, len(new_events), total)
 
     return jsonify({
         'success': True,
         'events': new_events,
-        'last_index': len(events),  # Next index to request
-        'total_events': len(events)
+        'last_index': total,  # Next index to request
+        'total_events': total
     })
 
 
@@ -598,49 +1489,41 @@ def analyze_document():
     enabled_sections = data.get('enabled_sections', None)  # NEW: Optional list of enabled section IDs
     session_id = data.get('session_id', f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
 
-    # Track session timestamp for cleanup
-    session_timestamps[session_id] = datetime.now()
-
     # Validate
     if not pdf_path or not os.path.exists(pdf_path):
-        return jsonify({'success': False, 'error': 'PDF file not found'}), 404
+        return _json_error('PDF file not found', 404)
 
     # Get API key
-    openai_key = os.getenv('OPENAI_API_KEY')
+    openai_key = Config.OPENAI_API_KEY
     if not openai_key:
-        return jsonify({'success': False, 'error': 'API key not configured'}), 500
+        return _json_error('API key not configured', 500)
 
-    # Create progress queue for this session (atomic to prevent race condition)
-    progress_queues.setdefault(session_id, queue.Queue(maxsize=1000))
-    progress_q = progress_queues[session_id]
-
-    # Create event list for polling (NEW)
-    session_events.setdefault(session_id, [])
+    # Session record: progress queue (SSE), event list (polling), thread, timestamp for cleanup
+    with session_lock:
+        state = _touch_session(session_id)
 
     # Define progress callback - stores events for BOTH SSE (legacy) and polling (NEW)
     def progress_callback(event_type: str, event_data: dict):
         # Store in list for polling (NEW - primary method)
         event_obj = {'event': event_type, **event_data, 'timestamp': datetime.now().isoformat()}
-        session_events[session_id].append(event_obj)
-        logger.info(f"📥 Event stored: {event_type} (total: {len(session_events[session_id])})")
+        state.add_event(event_obj)
+        logger.debug("📥 Event stored: %s (total: %s)", event_type, state.event_count)
 
-        # Also queue for SSE (legacy compatibility)
-        try:
-            progress_q.put_nowait((event_type, event_data))
-        except queue.Full:
-            logger.warning(f"Progress queue full, dropping SSE event: {event_type}")
+        # Also queue for SSE (legacy compatibility) - serialized once, here, not per yield
+        state.push_progress((event_type, _sse_message(event_obj)))
 
     # Define analysis function to run in thread
     def run_analysis():
         try:
-            logger.info(f"Starting analysis in thread: {session_id}")
+            logger.info("Starting analysis in thread: %s", session_id)
             if enabled_sections:
-                logger.info(f"Enabled sections: {enabled_sections}")
+                logger.info("Enabled sections: %s", enabled_sections)
 
             # Get config path
-            config_path = str(Config.BASE_DIR / 'config' / 'cipp_questions_default.json')
+            config_path = Config.QUESTIONS_CONFIG_FILE
 
             # Initialize orchestrator
+            from services.hotdog import HotdogOrchestrator
             orchestrator = HotdogOrchestrator(
                 openai_api_key=openai_key,
                 config_path=config_path,
@@ -648,282 +1531,210 @@ def analyze_document():
                 progress_callback=progress_callback
             )
 
-            # Store in active_analyses IMMEDIATELY (for partial results)
-            active_analyses[session_id] = {
-                'orchestrator': orchestrator,
-                'config_path': config_path,
-                'pdf_path': pdf_path,
-                'pdf_filename': pdf_filename
-            }
-            logger.info(f"Orchestrator stored in active_analyses: {session_id}")
-
-            # Run analysis (blocking in THIS thread, not main Flask thread)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(
-                    orchestrator.analyze_document(pdf_path, config_path, enabled_sections)
-                )
-
-                # Move to completed results
-                analysis_results[session_id] = {
-                    'result': result,
-                    'orchestrator': orchestrator,
-                    'config_path': config_path
-                }
-
-                # Format result for browser and store in session_events for polling
-                from services.hotdog.layers import ConfigurationLoader
-                config_loader = ConfigurationLoader()
-                parsed_config = config_loader.load_from_json(config_path)
-                browser_output = orchestrator.get_browser_output(result, parsed_config)
-                legacy_result = _transform_to_legacy_format(browser_output)
-
-                # Store full result in session_events so frontend can access via polling
-                progress_callback('results_ready', {
-                    'result': legacy_result,
-                    'statistics': {
-                        'processing_time': result.processing_time_seconds,
-                        'total_tokens': result.total_tokens,
-                        'estimated_cost': f"${result.estimated_cost:.4f}",
-                        'questions_answered': result.questions_answered,
-                        'total_questions': parsed_config.total_questions,
-                        'average_confidence': f"{result.average_confidence:.0%}"
-                    }
-                })
-
-                # CRITICAL: Atomic session movement with lock
-                # Prevents admin panel from seeing mid-transition state
-                with session_lock:
-                    # Move from active to completed (preserve session data)
-                    if session_id in active_analyses:
-                        completed_analyses[session_id] = {
-                            'result': result,
-                            'orchestrator': orchestrator,
-                            'config_path': config_path,
-                            'pdf_path': pdf_path,
-                            'pdf_filename': pdf_filename,
-                            'completed_at': datetime.now(),
-                            'status': 'completed'
-                        }
-                        del active_analyses[session_id]
-                        # Update timestamp so cleanup doesn't delete recently completed analyses
-                        session_timestamps[session_id] = datetime.now()
-                        logger.info(f"✅ Session moved to completed_analyses: {session_id}")
-
-                # Signal done
-                progress_q.put(('done', {}))
-
-                logger.info(f"Analysis complete: {session_id}")
-
-            finally:
-                loop.close()
+            # Register as active IMMEDIATELY (for partial results)
+            # Under the lock: admin/cleanup iterate the registry while holding it
+            record = AnalysisRecord(
+                status='active',
+                orchestrator=orchestrator,
+                config_path=config_path,
+                pdf_path=pdf_path,
+                pdf_filename=pdf_filename
+            )
+            with session_lock:
+                analyses[session_id] = record
+            logger.info("Orchestrator registered as active: %s", session_id)
+
+            # Run analysis on the shared loop; THIS thread (not the Flask one) waits on it
+            result = asyncio.run_coroutine_threadsafe(
+                orchestrator.analyze_document(pdf_path, config_path, enabled_sections),
+                _get_analysis_loop()
+            ).result()
+
+            # Format result for browser once - get_results serves this same payload
+            record.result = result
+            _, statistics = _completed_payload(record)
+
+            # Only a marker goes in the event log: the full result is cached on the
+            # record, and every poll/SSE reader that saw it inline re-encoded it
+            progress_callback('results_ready', {
+                'result_available': True,
+                'statistics': statistics
+            })
+
+            # CRITICAL: Atomic session movement with lock
+            # Prevents admin panel from seeing mid-transition state
+            with session_lock:
+                # Active -> completed (the record keeps all session data)
+                if analyses.get(session_id) is record:
+                    record.completed_at = datetime.now()
+                    record.status = 'completed'
+                    # Update timestamp so cleanup doesn't delete recently completed analyses
+                    _touch_session(session_id)
+                    logger.info("✅ Session completed: %s", session_id)
+
+            # Signal done
+            state.push_progress(('done', SSE_DONE))
+
+            logger.info("Analysis complete: %s", session_id)
 
         except Exception as e:
-            logger.error(f"Analysis failed: {e}", exc_info=True)
+            logger.error("Analysis failed: %s", e, exc_info=True)
             error_msg = str(e)
-            progress_q.put(('error', error_msg))
+            state.push_progress(('error', _sse_message({'event': 'error', 'error': error_msg})))
 
             # Handle stopped vs failed analyses differently
             if 'stopped by user' in error_msg.lower():
                 # CRITICAL: Atomic session movement with lock
-                # Prevents /api/results from getting 404 before session moves to partial_analyses
+                # Prevents /api/results from getting 404 before the session turns partial
                 with session_lock:
-                    # Move stopped analysis to partial_analyses (preserve partial data)
-                    if session_id in active_analyses:
-                        partial_analyses[session_id] = {
-                            'orchestrator': active_analyses[session_id]['orchestrator'],
-                            'config_path': active_analyses[session_id]['config_path'],
-                            'pdf_path': active_analyses[session_id].get('pdf_path', ''),
-                            'pdf_filename': active_analyses[session_id].get('pdf_filename', 'Unknown.pdf'),
-                            'stopped_at': datetime.now(),
-                            'status': 'stopped',
-                            'error': error_msg
-                        }
-                        del active_analyses[session_id]
+                    # Active -> partial (the record keeps the orchestrator's partial data)
+                    record = analyses.get(session_id)
+                    if record is not None and record.status == 'active':
+                        record.stopped_at = datetime.now()
+                        record.error = error_msg
+                        record.status = 'partial'
                         # Update timestamp so cleanup doesn't delete stopped analyses
-                        session_timestamps[session_id] = datetime.now()
-                        logger.info(f"✅ Session moved to partial_analyses: {session_id}")
+                        _touch_session(session_id)
+                        logger.info("✅ Session stopped with partial results: %s", session_id)
             else:
                 # Clean up failed analysis on actual errors
-                if session_id in active_analyses:
-                    del active_analyses[session_id]
-                    logger.info(f"Session cleaned up due to error: {session_id}")
+                with session_lock:
+                    record = analyses.get(session_id)
+                    removed = record is not None and record.status == 'active'
+                    if removed:
+                        del analyses[session_id]
+                if removed:
+                    logger.info("Session cleaned up due to error: %s", session_id)
 
     # Start analysis thread
     thread = threading.Thread(target=run_analysis, daemon=True)
-    analysis_threads[session_id] = thread
+    state.thread = thread
     thread.start()
 
-    logger.info(f"Analysis thread started: {session_id}")
+    logger.info("Analysis thread started: %s", session_id)
 
-    # Return immediately (don't wait for analysis)
-    return jsonify({
+    # Return immediately (don't wait for analysis) - 202 Accepted, poll the linked resources
+    results_url = f'/api/results/{session_id}'
+    response = jsonify({
         'success': True,
         'session_id': session_id,
-        'message': 'Analysis started in background'
+        'message': 'Analysis started in background',
+        'events_url': f'/api/events/{session_id}',
+        'results_url': results_url
     })
+    response.status_code = 202
+    response.headers['Location'] = results_url
+    return response
 
 
 # ============================================================================
 # GET RESULTS
 # ============================================================================
 
-@app.route('/api/results/<session_id>', methods=['GET'])
-def get_results(session_id):
-    """
-    Get analysis results (supports completed, partial, and in-progress analyses).
-
-    THREAD SAFETY: Uses session_lock to prevent race conditions when checking
-    which dict contains the session (completed vs partial vs active).
-    """
-
-    # CRITICAL: Atomic session lookup with lock
-    # Prevents race where session moves between dicts during lookup
-    with session_lock:
-        # Check completed_analyses first (NEW - primary storage)
-        if session_id in completed_analyses:
-            # Touch timestamp to keep session alive
-            session_timestamps[session_id] = datetime.now()
-            session_data = completed_analyses[session_id]
-            session_type = 'completed'
-        elif session_id in partial_analyses:
-            # Touch timestamp to keep session alive
-            session_timestamps[session_id] = datetime.now()
-            session_data = partial_analyses[session_id]
-            session_type = 'partial'
-        elif session_id in analysis_results:
-            session_data = analysis_results[session_id]
-            session_type = 'legacy'
-        elif session_id in active_analyses:
-            session_data = active_analyses[session_id]
-            session_type = 'active'
-        else:
-            # Session not found in any dict
-            logger.warning(f"Session not found: {session_id}")
-            logger.info(f"Active: {list(active_analyses.keys())}")
-            logger.info(f"Completed: {list(completed_analyses.keys())}")
-            logger.info(f"Partial: {list(partial_analyses.keys())}")
-            return jsonify({
-                'success': False,
-                'error': 'Session not found',
-                'message': 'Analysis session does not exist or has been cleaned up'
-            }), 404
-
-    # Process results based on session type (outside lock to avoid long hold)
-    from services.hotdog.layers import ConfigurationLoader
-    config_loader = ConfigurationLoader()
-
-    if session_type == 'completed':
-        result = session_data['result']
-        orchestrator = session_data['orchestrator']
-
-        parsed_config = config_loader.load_from_json(session_data['config_path'])
-        browser_output = orchestrator.get_browser_output(result, parsed_config)
-        legacy_result = _transform_to_legacy_format(browser_output)
-
-        return jsonify({
-            'success': True,
-            'result': legacy_result,
-            'statistics': {
-                'processing_time': result.processing_time_seconds,
-                'total_tokens': result.total_tokens,
-                'estimated_cost': f"${result.estimated_cost:.4f}",
-                'questions_answered': result.questions_answered,
-                'total_questions': parsed_config.total_questions,
-                'average_confidence': f"{result.average_confidence:.0%}"
-            }
-        })
+def _completed_results(record):
+    # Finished results never change - formatted once, then served from the record
+    legacy_result, statistics = _completed_payload(record)
+    return jsonify({
+        'success': True,
+        'result': legacy_result,
+        'statistics': statistics
+    })
 
-    elif session_type == 'legacy':
-        result = session_data['result']
-        orchestrator = session_data['orchestrator']
 
-        parsed_config = config_loader.load_from_json(session_data['config_path'])
-        browser_output = orchestrator.get_browser_output(result, parsed_config)
-        legacy_result = _transform_to_legacy_format(browser_output)
+def _partial_payload(record):
+    """
+    (legacy_result, questions_answered, total_questions) for the answers
+    accumulated so far. A stopped analysis can't change any more, so it is
+    built once and kept on the record; a running one is rebuilt every call -
+    the accumulator merges into existing Answer objects, so there is no
+    cheap key that says nothing changed.
+    """
+    cached = record.partial_payload
+    if cached is not None:
+        return cached
+    # Read before building: answers read while still running must not be kept
+    stopped = record.status == 'partial'
+
+    # Get accumulated answers so far
+    accumulated_answers = record.orchestrator.layer4_accumulator.get_accumulated_answers()
+    parsed_config = _load_parsed_config(record.config_path)
+
+    # Legacy format built directly from the Answer objects
+    payload = (
+        _partial_legacy_result(accumulated_answers, parsed_config),
+        sum(len(answers) for answers in accumulated_answers.values()),
+        parsed_config.total_questions
+    )
+    if stopped:
+        record.partial_payload = payload
+    return payload
 
-        return jsonify({
-            'success': True,
-            'result': legacy_result,
-            'statistics': {
-                'processing_time': result.processing_time_seconds,
-                'total_tokens': result.total_tokens,
-                'estimated_cost': f"${result.estimated_cost:.4f}",
-                'questions_answered': result.questions_answered,
-                'total_questions': parsed_config.total_questions,
-                'average_confidence': f"{result.average_confidence:.0%}"
-            }
-        })
 
-    elif session_type == 'partial':
-        logger.info(f"Fetching results for partial analysis: {session_id}")
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
+def _partial_results(record, cost_label, confidence_label):
+    """Answers accumulated so far, for a running (or stopped) analysis."""
+    legacy_result, questions_answered, total_questions = _partial_payload(record)
 
-        # Get accumulated answers so far
-        accumulated_answers = orchestrator.layer4_accumulator.get_accumulated_answers()
+    return jsonify({
+        'success': True,
+        'result': legacy_result,
+        'partial': True,  # Flag indicating partial / in-progress results
+        'statistics': {
+            'processing_time': 0,  # Not yet available
+            'total_tokens': record.orchestrator.layer5_token_manager.total_tokens_used,
+            'estimated_cost': cost_label,
+            'questions_answered': questions_answered,
+            'total_questions': total_questions,
+            'average_confidence': confidence_label
+        }
+    })
 
-        parsed_config = config_loader.load_from_json(config_path)
 
-        # Build partial browser output
-        partial_browser_output = orchestrator._build_partial_browser_output(
-            accumulated_answers,
-            parsed_config
-        )
+def _stopped_results(record):
+    return _partial_results(record, 'Stopped', 'Partial')
 
-        # Transform to legacy format
-        legacy_result = _transform_to_legacy_format(partial_browser_output)
 
-        return jsonify({
-            'success': True,
-            'result': legacy_result,
-            'partial': True,  # Flag indicating partial results
-            'statistics': {
-                'processing_time': 0,  # Not yet available
-                'total_tokens': orchestrator.layer5_token_manager.total_tokens_used,
-                'estimated_cost': 'Stopped',
-                'questions_answered': len([a for answers in accumulated_answers.values() for a in answers]),
-                'total_questions': parsed_config.total_questions,
-                'average_confidence': 'Partial'
-            }
-        })
+def _active_results(record):
+    if record.result is not None:
+        # Finished, about to flip to 'completed' - serve the final payload already
+        return _completed_results(record)
+    return _partial_results(record, 'In progress', 'In progress')
 
-    elif session_type == 'active':
-        logger.info(f"Fetching partial results for active analysis: {session_id}")
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
 
-        # Get accumulated answers so far
-        accumulated_answers = orchestrator.layer4_accumulator.get_accumulated_answers()
+# get_results dispatch by AnalysisRecord.status
+RESULTS_HANDLERS = {
+    'completed': _completed_results,
+    'partial': _stopped_results,
+    'active': _active_results,
+}
 
-        parsed_config = config_loader.load_from_json(config_path)
 
-        # Build partial browser output
-        partial_browser_output = orchestrator._build_partial_browser_output(
-            accumulated_answers,
-            parsed_config
-        )
-
-        # Transform to legacy format
-        legacy_result = _transform_to_legacy_format(partial_browser_output)
+@app.route('/api/results/<session_id>', methods=['GET'])
+def get_results(session_id):
+    """
+    Get analysis results (supports completed, partial, and in-progress analyses).
 
-        return jsonify({
-            'success': True,
-            'result': legacy_result,
-            'partial': True,  # Flag indicating in-progress
-            'statistics': {
-                'processing_time': 0,  # Not yet available
-                'total_tokens': orchestrator.layer5_token_manager.total_tokens_used,
-                'estimated_cost': 'In progress',
-                'questions_answered': len([a for answers in accumulated_answers.values() for a in answers]),
-                'total_questions': parsed_config.total_questions,
-                'average_confidence': 'In progress'
-            }
-        })
+    THREAD SAFETY: Uses session_lock so the status read is consistent with
+    the analysis thread's transitions (active -> completed/partial).
+    """
+    # CRITICAL: Atomic lookup with lock - one probe of the registry
+    with session_lock:
+        record = analyses.get(session_id)
+        if record is None:
+            logger.warning("Session not found: %s", session_id)
+            return jsonify({
+                'success': False,
+                'error': 'Session not found',
+                'message': 'Analysis session does not exist or has been cleaned up'
+            }), 404
+        status = record.status
+        if status != 'active':
+            # Touch timestamp to keep session alive
+            _touch_session(session_id)
 
-    # Should never reach here due to lock check above
-    return jsonify({'success': False, 'error': 'Internal error'}), 500
+    # Build the response outside the lock to avoid a long hold
+    if status != 'completed':
+        logger.info("Fetching %s results for: %s", status, session_id)
+    return RESULTS_HANDLERS[status](record)
 
 
 # ============================================================================
@@ -934,111 +1745,66 @@ def get_results(session_id):
 def export_excel_dashboard(session_id):
     """Generate executive Excel dashboard with charts (supports partial results)"""
 
-    browser_output = None
-    is_partial = False
-
-    # Check completed_analyses first (NEW - primary storage)
-    if session_id in completed_analyses:
-        logger.info(f"Exporting completed analysis: {session_id}")
-        session_data = completed_analyses[session_id]
-        result = session_data['result']
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
-
-        # Get complete browser-formatted output
-        from services.hotdog.layers import ConfigurationLoader
-        config_loader = ConfigurationLoader()
-        parsed_config = config_loader.load_from_json(config_path)
-        browser_output = orchestrator.get_browser_output(result, parsed_config)
-        is_partial = False
-
-    # Check legacy analysis_results (LEGACY - backward compatibility)
-    elif session_id in analysis_results:
-        logger.info(f"Exporting completed analysis (legacy): {session_id}")
-        session_data = analysis_results[session_id]
-        result = session_data['result']
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
-
-        # Get complete browser-formatted output
-        from services.hotdog.layers import ConfigurationLoader
-        config_loader = ConfigurationLoader()
-        parsed_config = config_loader.load_from_json(config_path)
-        browser_output = orchestrator.get_browser_output(result, parsed_config)
+    # One registry probe, under the lock like get_results so a finished
+    # session being exported is also kept alive by cleanup
+    with session_lock:
+        record = analyses.get(session_id)
+        if record is None:
+            return _json_error('Session not found', 404)
+        if record.status != 'active':
+            _touch_session(session_id)
+
+    if record.result is not None:
+        logger.info("Exporting completed analysis: %s", session_id)
+
+        # Same legacy-format result /api/results serves - formatted once per record
+        # (Excel generator expects: question, answer, page_citations)
+        legacy_result, _ = _completed_payload(record)
         is_partial = False
 
-    # Check partial_analyses (stopped by user)
-    elif session_id in partial_analyses:
-        logger.info(f"Exporting partial analysis: {session_id}")
-        session_data = partial_analyses[session_id]
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
-
-        # Get accumulated answers so far
-        accumulated_answers = orchestrator.layer4_accumulator.get_accumulated_answers()
-
-        # Load config
-        from services.hotdog.layers import ConfigurationLoader
-        config_loader = ConfigurationLoader()
-        parsed_config = config_loader.load_from_json(config_path)
-
-        # Build partial browser output
-        browser_output = orchestrator._build_partial_browser_output(
-            accumulated_answers,
-            parsed_config
-        )
-        is_partial = True
-
-    # Check active analyses (in-progress)
-    elif session_id in active_analyses:
-        logger.info(f"Exporting partial/stopped analysis: {session_id}")
-        session_data = active_analyses[session_id]
-        orchestrator = session_data['orchestrator']
-        config_path = session_data['config_path']
-
-        # Get accumulated answers so far
-        accumulated_answers = orchestrator.layer4_accumulator.get_accumulated_answers()
-
-        # Load config
-        from services.hotdog.layers import ConfigurationLoader
-        config_loader = ConfigurationLoader()
-        parsed_config = config_loader.load_from_json(config_path)
-
-        # Build partial browser output
-        browser_output = orchestrator._build_partial_browser_output(
-            accumulated_answers,
-            parsed_config
-        )
-        is_partial = True
-
     else:
-        return jsonify({'success': False, 'error': 'Session not found'}), 404
+        # Stopped by user, or still in progress (stopped ones are formatted once)
+        logger.info("Exporting %s analysis: %s", record.status, session_id)
+        legacy_result = _partial_payload(record)[0]
+        is_partial = True
 
     try:
         # Lazy import to prevent app crash if openpyxl not installed
         from services.excel_dashboard import ExcelDashboardGenerator
 
-        # CRITICAL: Transform HOTDOG format to legacy format for Excel generator
-        # browser_output uses: question_text, primary_answer.text, primary_answer.pages
-        # Excel generator expects: question, answer, page_citations
-        legacy_result = _transform_to_legacy_format(browser_output)
-
         # Generate Excel dashboard (now works with both complete and partial)
+        # Written to an anonymous scratch file and streamed back from disk
+        # (sendfile under gunicorn) instead of being held whole in a BytesIO.
+        # The OS drops the file when the server closes it after sending.
         generator = ExcelDashboardGenerator(legacy_result, is_partial=is_partial)
-        excel_file = generator.generate()
+        excel_file = tempfile.TemporaryFile(prefix='dashboard-', suffix='.xlsx', dir=UPLOAD_DIR)
+        try:
+            _run_export(lambda: generator.generate(excel_file))
+        except BaseException:
+            excel_file.close()
+            raise
+        size = excel_file.tell()
+        excel_file.seek(0)
 
         # Use different filename for partial exports
         filename = 'CIPP_Executive_Dashboard_PARTIAL.xlsx' if is_partial else 'CIPP_Executive_Dashboard.xlsx'
 
-        return send_file(
+        response = send_file(
             excel_file,
             mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             as_attachment=True,
-            download_name=filename
+            download_name=filename,
+            max_age=0  # per-session report - opt out of SEND_FILE_MAX_AGE_DEFAULT, always revalidate
         )
+        response.content_length = size  # send_file only knows it for paths and BytesIO
+        return response
+
+    except TimeoutError:
+        logger.error("Excel export timed out after %ss: %s", EXCEL_EXPORT_TIMEOUT_SECONDS, session_id)
+        return _json_error('Excel export timed out', 504)
 
     except Exception as e:
-        logger.error(f"Excel export failed: {e}", exc_info=True)
+        logger.error("Excel export failed: %s", e, exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -1049,65 +1815,58 @@ def export_excel_dashboard(session_id):
 @app.route('/api/stop/<session_id>', methods=['POST'])
 def stop_analysis(session_id):
     """
-    Stop ongoing analysis and wait for session to move to partial_analyses.
+    Stop ongoing analysis and wait for the session to turn partial.
 
     CRITICAL FIX: This endpoint now WAITS for the analysis thread to move
-    the session from active_analyses to partial_analyses before returning.
+    the session from 'active' to 'partial' before returning.
     This prevents race condition where frontend calls fetchResults() before
     session is available.
 
     See: STOP_ANALYSIS_RACE_CONDITION.md
     """
-    logger.info(f"⏹️  Stop requested for: {session_id}")
+    logger.info("⏹️  Stop requested for: %s", session_id)
 
     # Check if session exists (with lock for thread safety)
     with session_lock:
+        record = analyses.get(session_id)
+        if record is None:
+            logger.warning("Session not found: %s", session_id)
+            return _json_error('Session not found', 404)
+
         # Already completed or stopped?
-        if session_id in completed_analyses:
-            logger.info(f"Analysis already complete: {session_id}")
+        if record.status == 'completed' or record.result is not None:
+            logger.info("Analysis already complete: %s", session_id)
             return jsonify({'success': True, 'message': 'Analysis already complete'})
 
-        if session_id in partial_analyses:
-            logger.info(f"Analysis already stopped: {session_id}")
+        if record.status == 'partial':
+            logger.info("Analysis already stopped: %s", session_id)
             return jsonify({'success': True, 'message': 'Analysis already stopped'})
 
-        if session_id in analysis_results:
-            logger.info(f"Analysis already complete (legacy): {session_id}")
-            return jsonify({'success': True, 'message': 'Analysis already complete'})
-
-        # Is it active?
-        if session_id not in active_analyses:
-            logger.warning(f"Session not found: {session_id}")
-            logger.info(f"Active: {list(active_analyses.keys())}")
-            return jsonify({'success': False, 'error': 'Session not found'}), 404
-
         # Set stop flag on orchestrator
-        orchestrator = active_analyses[session_id]['orchestrator']
-        orchestrator.stop_requested = True
-        logger.info(f"✅ Stop flag set on orchestrator: {session_id}")
+        record.orchestrator.stop_requested = True
+        logger.info("✅ Stop flag set on orchestrator: %s", session_id)
 
     # Send error event to progress queue
-    if session_id in progress_queues:
-        try:
-            progress_queues[session_id].put_nowait(('error', 'Analysis stopped by user'))
-            logger.info(f"Stop event queued: {session_id}")
-        except:
-            pass  # Queue might be full
+    state = analysis_sessions.get(session_id)
+    if state is not None:
+        state.push_progress(('error', _sse_message({'event': 'error', 'error': 'Analysis stopped by user'})))
+        logger.info("Stop event queued: %s", session_id)
 
-    # CRITICAL: Wait for session to move to partial_analyses
-    # The analysis thread will catch the exception and move the session
+    # CRITICAL: Wait for the session to turn partial
+    # The analysis thread will catch the exception and flip the status
     max_wait = 10.0  # 10 seconds timeout
     start_time = time.time()
     check_interval = 0.1  # Check every 100ms
 
-    logger.info(f"⏳ Waiting for session to move to partial_analyses (max {max_wait}s)...")
+    logger.info("⏳ Waiting for session to turn partial (max %ss)...", max_wait)
 
     while time.time() - start_time < max_wait:
         with session_lock:
-            # Check if session moved to partial_analyses or completed
-            if session_id in partial_analyses:
+            # Check if session turned partial or completed
+            status = record.status if analyses.get(session_id) is record else None
+            if status == 'partial':
                 elapsed = time.time() - start_time
-                logger.info(f"✅ Session moved to partial_analyses ({elapsed:.2f}s): {session_id}")
+                logger.info("✅ Session stopped (%.2fs): %s", elapsed, session_id)
                 return jsonify({
                     'success': True,
                     'message': 'Analysis stopped',
@@ -1115,9 +1874,9 @@ def stop_analysis(session_id):
                     'wait_time': f"{elapsed:.2f}s"
                 })
 
-            if session_id in completed_analyses:
+            if status == 'completed':
                 elapsed = time.time() - start_time
-                logger.info(f"✅ Session completed before stop ({elapsed:.2f}s): {session_id}")
+                logger.info("✅ Session completed before stop (%.2fs): %s", elapsed, session_id)
                 return jsonify({
                     'success': True,
                     'message': 'Analysis completed',
@@ -1125,10 +1884,10 @@ def stop_analysis(session_id):
                     'wait_time': f"{elapsed:.2f}s"
                 })
 
-            # Still in active_analyses - keep waiting
-            if session_id not in active_analyses:
+            # Still active - keep waiting
+            if status is None:
                 # Session disappeared (unexpected)
-                logger.warning(f"⚠️ Session vanished during stop: {session_id}")
+                logger.warning("⚠️ Session vanished during stop: %s", session_id)
                 return jsonify({
                     'success': False,
                     'error': 'Session disappeared during stop'
@@ -1136,8 +1895,8 @@ def stop_analysis(session_id):
 
         time.sleep(check_interval)
 
-    # Timeout - session still in active_analyses
-    logger.error(f"❌ Timeout waiting for session to stop ({max_wait}s): {session_id}")
+    # Timeout - session still active
+    logger.error("❌ Timeout waiting for session to stop (%ss): %s", max_wait, session_id)
     return jsonify({
         'success': False,
         'error': f'Stop timeout - session still active after {max_wait}s',
@@ -1149,105 +1908,86 @@ def stop_analysis(session_id):
 # ADMIN ENDPOINTS
 # ============================================================================
 
+def _session_summary(session_id, record):
+    """
+    Admin-view dict for one analysis. A record's fields only change when its
+    status does, so the dict (timestamps already isoformat'd) is built once
+    per status and kept on the record - an admin refresh just collects them.
+    """
+    status = record.status
+    cached = record.summary
+    if cached is not None and cached['status'] == status:
+        return cached
+    try:
+        info = {
+            'session_id': session_id,
+            'status': status,
+            'pdf_path': record.pdf_path or 'N/A',
+            'pdf_filename': record.pdf_filename,
+            'config_path': record.config_path or 'N/A',
+            'started_at': record.started_at.isoformat()
+        }
+
+        # Add timestamp if available
+        if record.completed_at is not None:
+            info['completed_at'] = record.completed_at.isoformat()
+        if record.stopped_at is not None:
+            info['stopped_at'] = record.stopped_at.isoformat()
+
+        # Add result statistics if available (with error handling)
+        if record.result is not None:
+            result = record.result
+            # Check if result has the expected attributes (it's a dataclass)
+            info['questions_answered'] = getattr(result, 'questions_answered', 'N/A')
+            info['total_pages'] = getattr(result, 'total_pages', 'N/A')
+            info['total_tokens'] = getattr(result, 'total_tokens', 'N/A')
+            info['processing_time'] = getattr(result, 'processing_time_seconds', 'N/A')
+    except Exception as e:
+        # Log the error but still return basic info (not cached - retried next refresh)
+        logger.error("Error formatting session %s: %s", session_id, e, exc_info=True)
+        return {
+            'session_id': session_id,
+            'status': f'error_{status}',
+            'pdf_path': 'Error formatting',
+            'config_path': 'Error formatting',
+            'error': str(e)
+        }
+
+    record.summary = info
+    return info
+
+
 @app.route('/api/admin/sessions', methods=['GET'])
 def get_all_sessions():
     """Admin endpoint: Get all active, completed, and partial analyses"""
-    from datetime import datetime
 
     # DIAGNOSTIC LOGGING (with module reload detection)
     logger.info("="*60)
-    logger.info(f"ADMIN SESSIONS REQUEST | Module: {MODULE_LOAD_ID} | PID: {os.getpid()}")
-    logger.info(f"Active analyses keys: {list(active_analyses.keys())}")
-    logger.info(f"Completed analyses keys: {list(completed_analyses.keys())}")
-    logger.info(f"Partial analyses keys: {list(partial_analyses.keys())}")
-    logger.info(f"Legacy results keys: {list(analysis_results.keys())}")
-    logger.info(f"Session timestamps keys: {list(session_timestamps.keys())}")
+    logger.info("ADMIN SESSIONS REQUEST | Module: %s | PID: %s", MODULE_LOAD_ID, os.getpid())
     logger.info("="*60)
 
-    def format_session_info(session_id, session_data, status):
-        """Helper to format session data for admin view"""
-        try:
-            info = {
-                'session_id': session_id,
-                'status': status,
-                'pdf_path': session_data.get('pdf_path', 'N/A'),
-                'pdf_filename': session_data.get('pdf_filename', 'Unknown.pdf'),
-                'config_path': session_data.get('config_path', 'N/A'),
-            }
-
-            # Add timestamp if available
-            if 'completed_at' in session_data:
-                info['completed_at'] = session_data['completed_at'].isoformat()
-            if 'stopped_at' in session_data:
-                info['stopped_at'] = session_data['stopped_at'].isoformat()
-            if 'started_at' in session_data:
-                info['started_at'] = session_data['started_at'].isoformat()
-
-            # Add result statistics if available (with error handling)
-            if 'result' in session_data:
-                result = session_data['result']
-                # Check if result has the expected attributes (it's a dataclass)
-                info['questions_answered'] = getattr(result, 'questions_answered', 'N/A')
-                info['total_pages'] = getattr(result, 'total_pages', 'N/A')
-                info['total_tokens'] = getattr(result, 'total_tokens', 'N/A')
-                info['processing_time'] = getattr(result, 'processing_time_seconds', 'N/A')
-
-            return info
-        except Exception as e:
-            # Log the error but still return basic info
-            logger.error(f"Error formatting session {session_id}: {e}", exc_info=True)
-            return {
-                'session_id': session_id,
-                'status': f'error_{status}',
-                'pdf_path': 'Error formatting',
-                'config_path': 'Error formatting',
-                'error': str(e)
-            }
-
     # CRITICAL: Atomic snapshot of all session dicts with lock
     # Prevents race conditions where sessions appear/disappear during iteration
     with session_lock:
         # Touch all session timestamps to keep them alive when admin views them
-        all_session_ids = (
-            list(active_analyses.keys()) +
-            list(completed_analyses.keys()) +
-            list(partial_analyses.keys()) +
-            list(analysis_results.keys())
-        )
-        for sid in all_session_ids:
-            session_timestamps[sid] = datetime.now()
+        all_records = list(analyses.items())
+        for sid, _ in all_records:
+            _touch_session(sid)
 
         # ENHANCED DIAGNOSTIC: Log what we see INSIDE the lock
         logger.info("🔍 INSIDE LOCK:")
-        logger.info(f"🔍   Module ID: {MODULE_LOAD_ID} | PID: {os.getpid()} | Uptime: {time.time() - MODULE_LOAD_TIME:.1f}s")
-        logger.info(f"🔍   Active keys: {list(active_analyses.keys())}")
-        logger.info(f"🔍   Completed keys: {list(completed_analyses.keys())}")
-        logger.info(f"🔍   Partial keys: {list(partial_analyses.keys())}")
-        logger.info(f"🔍   Legacy keys: {list(analysis_results.keys())}")
-        logger.info(f"🔍   Timestamps keys: {list(session_timestamps.keys())}")
-        logger.info(f"🔍   Dict memory IDs - completed={id(completed_analyses)}, partial={id(partial_analyses)}")
-        logger.info(f"🔍   Thread: {threading.current_thread().name}")
-        logger.info(f"🔍   Total session IDs collected: {len(all_session_ids)}")
-
-        # Gather all sessions (single atomic snapshot)
-        sessions = {
-            'active': [
-                format_session_info(sid, data, 'active')
-                for sid, data in active_analyses.items()
-            ],
-            'completed': [
-                format_session_info(sid, data, 'completed')
-                for sid, data in completed_analyses.items()
-            ],
-            'partial': [
-                format_session_info(sid, data, 'partial')
-                for sid, data in partial_analyses.items()
-            ],
-            'legacy': [
-                format_session_info(sid, data, 'legacy_completed')
-                for sid, data in analysis_results.items()
-            ]
-        }
+        logger.info("🔍   Module ID: %s | PID: %s | Uptime: %.1fs", MODULE_LOAD_ID, os.getpid(), time.time() - MODULE_LOAD_TIME)
+        logger.info("🔍   Analysis keys: %s", [sid for sid, _ in all_records])
+        logger.info("🔍   Session state keys: %s", list(analysis_sessions.keys()))
+        logger.info("🔍   Registry memory ID: %s", id(analyses))
+        logger.info("🔍   Thread: %s", threading.current_thread().name)
+        logger.info("🔍   Total session IDs collected: %s", len(all_records))
+
+        # Gather all sessions (single atomic snapshot), grouped by status.
+        # 'legacy' stays in the payload (always empty) for API compatibility.
+        sessions = {'active': [], 'completed': [], 'partial': [], 'legacy': []}
+        for sid, record in all_records:
+            sessions[record.status].append(_session_summary(sid, record))
 
     # Summary counts (can be done outside lock using snapshot)
     summary = {
@@ -1259,10 +1999,10 @@ def get_all_sessions():
     }
 
     # ENHANCED DIAGNOSTIC: Log what we're returning
-    logger.info(f"📤 RETURNING: {summary}")
-    logger.info(f"📤   Active sessions count: {len(sessions['active'])}")
-    logger.info(f"📤   Completed sessions count: {len(sessions['completed'])}")
-    logger.info(f"📤   Partial sessions count: {len(sessions['partial'])}")
+    logger.info("📤 RETURNING: %s", summary)
+    logger.info("📤   Active sessions count: %s", len(sessions['active']))
+    logger.info("📤   Completed sessions count: %s", len(sessions['completed']))
+    logger.info("📤   Partial sessions count: %s", len(sessions['partial']))
 
     return jsonify({
         'success': True,
@@ -1280,78 +2020,143 @@ def get_all_sessions():
 # CIPP ANALYZER FRONTEND
 # ============================================================================
 
-@app.route('/cipp-analyzer')
-def cipp_analyzer():
-    """Serve CIPP Analyzer application (REBUILT for HOTDOG AI)"""
-    return send_from_directory(Config.BASE_DIR, 'analyzer_rebuild.html')
+# Question config only changes on deploy - stat it once (existence + mtime), answer
+# revalidations with 304. Under the debug server it is re-checked per request so edits show up.
+QUESTIONS_CONFIG_MTIME = _file_mtime(Config.QUESTIONS_CONFIG_PATH)
+
+
+def _questions_config_mtime():
+    if app.debug:
+        return _file_mtime(Config.QUESTIONS_CONFIG_PATH)
+    return QUESTIONS_CONFIG_MTIME
+
+
+@functools.lru_cache(maxsize=4)
+def _question_config_body(config_mtime):
+    """The /api/config/questions body, read and encoded once per config file version."""
+    with open(Config.QUESTIONS_CONFIG_PATH, 'r', encoding='utf-8') as f:
+        config_data = json.load(f)
+
+    # Transform to frontend format
+    sections = config_data.get('sections', [])
+    total_questions = sum(len(section.get('questions', [])) for section in sections)
+
+    return _json_bytes({
+        'success': True,
+        'config': {
+            'sections': sections,
+            'totalQuestions': total_questions
+        }
+    })
 
-@app.route('/admin/sessions')
-def admin_sessions():
-    """Serve admin session monitoring page"""
-    # Note: Page is accessible but relies on obscure URL for basic protection
-    # API endpoint /api/admin/sessions can be protected separately if needed
-    return send_from_directory(Config.BASE_DIR, 'admin_sessions.html')
 
 @app.route('/api/config/questions', methods=['GET'])
 def get_question_config():
     """Load question configuration from JSON file"""
-    try:
-        config_path = Config.BASE_DIR / 'config' / 'cipp_questions_default.json'
+    config_mtime = _questions_config_mtime()
+    if config_mtime is None:
+        return _json_error('Question configuration file not found', 404)
 
-        if not config_path.exists():
-            return jsonify({
-                'success': False,
-                'error': 'Question configuration file not found'
-            }), 404
+    if request.if_modified_since and request.if_modified_since >= config_mtime:
+        return Response(status=304)
 
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-
-        # Transform to frontend format
-        sections = config_data.get('sections', [])
-        total_questions = sum(len(section.get('questions', [])) for section in sections)
-
-        return jsonify({
-            'success': True,
-            'config': {
-                'sections': sections,
-                'totalQuestions': total_questions
-            }
-        })
+    try:
+        # Keyed on the file's mtime, so an edited config (debug) is re-read
+        response = _json_response(_question_config_body(config_mtime))
+        response.last_modified = config_mtime
+        response.cache_control.no_cache = True  # always revalidate (cheap 304) so deploys show up
+        return response
 
     except Exception as e:
-        logger.error(f'Failed to load question config: {str(e)}')
+        logger.error("Failed to load question config: %s", e)
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
-@app.route('/progress-estimator')
-def progress_estimator():
-    """Serve CIPP Production Estimator (Comprehensive - All Penalties/Boosts/Pipe Sizes)"""
-    return send_from_directory(Config.BASE_DIR / 'legacy' / 'apps' / 'progress-estimator', 'CIPPEstimator_Comprehensive.html')
-
 
 # ============================================================================
 # OPENAI API PROXY (for Progress Estimator AI Insights)
 # ============================================================================
 
+OPENAI_CHAT_URL = 'https://api.openai.com/v1/chat/completions'
+# Built once from the import-time key; the browser only ever talks to the proxy
+OPENAI_HEADERS = {
+    'Content-Type': 'application/json',
+    'Authorization': f'Bearer {Config.OPENAI_API_KEY}'
+}
+OPENAI_KEY_MISSING_BODY = _json_bytes({
+    'success': False,
+    'error': 'OpenAI API key not configured on server. Contact administrator.'
+})
+_openai_http = None
+_openai_http_lock = threading.Lock()
+
+
+def _get_openai_http():
+    """
+    Shared requests.Session for the OpenAI proxy.
+
+    Keeps TLS connections to api.openai.com alive across requests instead of
+    paying a fresh TCP + TLS handshake on every chat call. Gateway errors
+    (502/503/504) are retried twice with a short backoff on the pooled
+    connection rather than surfaced to the estimator straight away.
+    """
+    global _openai_http
+    if _openai_http is None:
+        with _openai_http_lock:
+            if _openai_http is None:
+                import requests
+                from urllib3.util.retry import Retry
+                retry = Retry(
+                    total=2,
+                    connect=2,  # never reached OpenAI - nothing generated yet
+                    read=0,  # a read timeout may be a completion still running: don't bill it twice
+                    other=0,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    # POST is opted in only for the gateway statuses above (and
+                    # failed connects), where OpenAI produced no completion
+                    allowed_methods=frozenset({'POST'}),
+                    raise_on_status=False  # hand the last response back to the status check below
+                )
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=retry)
+                session.mount('https://', adapter)
+                _openai_http = session
+    return _openai_http
+
+
+def _relay_openai_stream(response):
+    """Yield OpenAI's SSE bytes as they arrive, then hand the connection back to the pool."""
+    import requests
+
+    try:
+        for chunk in response.iter_content(chunk_size=None):
+            yield chunk
+    except requests.exceptions.RequestException as e:
+        # Headers are long gone - tell the browser in-band and end the stream
+        logger.error("OpenAI stream interrupted: %s", e)
+        yield _sse_message({'error': 'OpenAI stream interrupted. Please try again.'})
+    finally:
+        response.close()
+
+
 @app.route('/api/openai/chat', methods=['POST'])
 def openai_chat_proxy():
     """
     Proxy endpoint for OpenAI API calls
     Securely uses server-side OPENAI_API_KEY from environment
+
+    With "stream": true in the body OpenAI's SSE chunks are relayed as they
+    arrive (time-to-first-token instead of time-to-full-completion);
+    otherwise the finished completion comes back in the usual JSON envelope.
     """
     import requests
 
-    # Get API key from environment
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
+    if not Config.OPENAI_API_KEY:
         logger.error("OPENAI_API_KEY not configured in environment")
-        return jsonify({
-            'success': False,
-            'error': 'OpenAI API key not configured on server. Contact administrator.'
-        }), 500
+        return _json_response(OPENAI_KEY_MISSING_BODY, 500)
 
     try:
         # Get request data from frontend
@@ -1371,37 +2176,48 @@ def openai_chat_proxy():
             'temperature': data.get('temperature', 0.7),
             'max_tokens': data.get('max_tokens', 600)
         }
-
-        logger.info(f"Proxying OpenAI request: model={openai_request['model']}, messages={len(openai_request['messages'])}")
-
-        # Call OpenAI API
-        response = requests.post(
-            'https://api.openai.com/v1/chat/completions',
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {api_key}'
-            },
-            json=openai_request,
-            timeout=30
+        stream = bool(data.get('stream'))
+        if stream:
+            openai_request['stream'] = True
+
+        logger.info("Proxying OpenAI request: model=%s, messages=%s", openai_request['model'], len(openai_request['messages']))
+
+        # Call OpenAI API (body pre-encoded with orjson; requests' json= uses the stdlib encoder)
+        response = _get_openai_http().post(
+            OPENAI_CHAT_URL,
+            headers=OPENAI_HEADERS,
+            data=orjson.dumps(openai_request) if orjson is not None else json.dumps(openai_request),
+            timeout=30,  # per read when streaming, so a long completion is fine
+            stream=stream
         )
 
         # Check response status
         if response.status_code != 200:
-            logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
+            logger.error("OpenAI API error: %s - %s", response.status_code, response.text)
             return jsonify({
                 'success': False,
                 'error': f'OpenAI API returned {response.status_code}',
                 'details': response.text
             }), response.status_code
 
-        # Return successful response
-        result = response.json()
-        logger.info(f"OpenAI response received: {result['choices'][0]['finish_reason']}")
+        if stream:
+            return Response(
+                _relay_openai_stream(response),
+                mimetype='text/event-stream',
+                headers={
+                    'Cache-Control': 'no-cache',
+                    'X-Accel-Buffering': 'no'
+                },
+                direct_passthrough=True
+            )
 
-        return jsonify({
-            'success': True,
-            'data': result
-        })
+        # Relay OpenAI's JSON body verbatim inside our envelope - no parse + re-encode round trip
+        body = response.content
+        if not body.lstrip().startswith(b'{'):
+            raise ValueError('OpenAI returned a non-JSON body')
+        logger.info("OpenAI response received: %d bytes", len(body))
+
+        return Response(b'{"data":' + body + b',"success":true}\n', mimetype='application/json')
 
     except requests.exceptions.Timeout:
         logger.error("OpenAI API request timed out")
@@ -1411,7 +2227,7 @@ def openai_chat_proxy():
         }), 504
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"OpenAI API request failed: {str(e)}")
+        logger.error("OpenAI API request failed: %s", e)
         return jsonify({
             'success': False,
             'error': 'Failed to connect to OpenAI API',
@@ -1419,7 +2235,7 @@ def openai_chat_proxy():
         }), 503
 
     except Exception as e:
-        logger.error(f"Unexpected error in OpenAI proxy: {str(e)}")
+        logger.error("Unexpected error in OpenAI proxy: %s", e)
         return jsonify({
             'success': False,
             'error': 'Internal server error',
@@ -1437,55 +2253,66 @@ try:
     dash_app = create_dash_app(app)
     logger.info("Visual Project Summary (Dash) integrated successfully")
 except ImportError as e:
-    logger.warning(f"Visual Project Summary not available: {e}")
+    logger.warning("Visual Project Summary not available: %s", e)
     dash_app = None
 
 
 # ============================================================================
-# HEALTH CHECK
+# ERROR HANDLERS
 # ============================================================================
 
-@app.route('/health', methods=['GET'])
-def health_check():
-    """Health check endpoint for Render monitoring"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'active_sessions': len(active_analyses),
-        'completed_sessions': len(analysis_results)
-    }), 200
-
+# Error bodies never change - encode them once instead of running jsonify per error
+NOT_FOUND_BODY = _json_bytes({'error': 'Not Found'})
+INTERNAL_ERROR_BODY = _json_bytes({'error': 'Internal Server Error'})
+UNEXPECTED_ERROR_BODY = _json_bytes({
+    'success': False,
+    'error': 'An unexpected error occurred. Please try again.'
+})
 
-# ============================================================================
-# ERROR HANDLERS
-# ============================================================================
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Not Found'}), 404
+    return _json_response(NOT_FOUND_BODY, 404)
+
+@app.errorhandler(413)
+def request_too_large(error):
+    """Chunked uploads have no Content-Length; Werkzeug trips MAX_CONTENT_LENGTH mid-parse."""
+    return _json_response(TOO_LARGE_BODY, 413)
 
 @app.errorhandler(500)
 def internal_error(error):
-    logger.error(f"Internal server error: {error}", exc_info=True)
-    return jsonify({'error': 'Internal Server Error'}), 500
+    logger.error("Internal server error: %s", error, exc_info=True)
+    return _json_response(INTERNAL_ERROR_BODY, 500)
 
 @app.errorhandler(Exception)
 def handle_exception(e):
     """Global exception handler - return JSON instead of HTML"""
-    logger.error(f"Unhandled exception: {e}", exc_info=True)
-    return jsonify({
-        'success': False,
-        'error': 'An unexpected error occurred. Please try again.'
-    }), 500
+    logger.error("Unhandled exception: %s", e, exc_info=True)
+    return _json_response(UNEXPECTED_ERROR_BODY, 500)
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
-# Start session cleanup scheduler
-cleanup_expired_sessions()
-logger.info("🧹 Session cleanup scheduler started (15-minute intervals)")
+def _is_helper_process():
+    """
+    True when app.py was imported by a process that never serves requests, so
+    one-off startup work (timers, banners) isn't duplicated there:
+    - spawn()ed extraction-pool children re-run the main script as __mp_main__
+    - under `python app.py` with DEBUG, the Werkzeug reloader's watcher parent
+      (the real server is the child it launches with WERKZEUG_RUN_MAIN=true)
+    """
+    if __name__ == '__mp_main__':
+        return True
+    uses_reloader = __name__ == '__main__' and os.getenv('DEBUG', 'false').lower() == 'true'
+    return uses_reloader and os.environ.get('WERKZEUG_RUN_MAIN') != 'true'
+
+
+# Start session cleanup scheduler (gunicorn's post_fork hook restarts it in each
+# worker when preload_app is on - timer threads don't survive fork)
+if not _is_helper_process():
+    start_cleanup_scheduler()
 
 if __name__ == '__main__':
     logger.info("="*60)
@@ -1496,8 +2323,10 @@ if __name__ == '__main__':
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('DEBUG', 'false').lower() == 'true'
 
-    logger.info(f"Starting server on port {port} (debug={debug})")
+    # Werkzeug dev server only - production runs gunicorn (see Procfile / gunicorn_config.py)
+    # so static files go out via wsgi.file_wrapper + sendfile(2)
+    logger.info("Starting server on port %s (debug=%s)", port, debug)
     app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
-else:
+elif __name__ != '__mp_main__':
     # For gunicorn
     logger.info("PM Tools Suite loaded (gunicorn mode)")
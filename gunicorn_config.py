@@ -12,9 +12,26 @@ backlog = 2048
 # Worker configuration - THREADING FOR ASYNC/CONCURRENT HANDLING
 # Using threaded workers since our app uses Python threading for analysis
 # This allows SSE streaming while analysis runs in background threads
-workers = 1  # Single worker with threading
-worker_class = 'sync'  # Sync worker + threading in Flask app
-threads = 10  # Allow 10 concurrent threads per worker
+# Sessions, progress queues and auth tokens live in per-process memory, so more
+# than one worker would split them - keep WEB_CONCURRENCY at 1 until the Neon
+# DB migration lands. gthread keeps /health and SSE responsive while a request
+# blocks on extraction.
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')  # Threaded worker (gunicorn would silently pick this for sync + threads > 1)
+threads = int(os.getenv('GUNICORN_THREADS', '10'))  # Concurrent requests per worker
+# app.py reads this to decide whether to gevent-patch at import (only for gevent workers)
+os.environ['GUNICORN_WORKER_CLASS'] = worker_class
+
+# GUNICORN_WORKER_CLASS=gevent switches to cooperative I/O: app.py already
+# monkey-patches sockets (thread=False keeps analysis on real threads), so
+# long SSE streams and OpenAI proxy calls each cost a greenlet, not a thread.
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', '1000'))  # gevent only
+
+# Import the app once in the master and fork workers from it: faster worker
+# (re)starts, copy-on-write sharing of the loaded modules, and import errors
+# fail the deploy instead of crash-looping workers. Off with --reload, which
+# needs each worker to import the code itself.
+preload_app = os.getenv('DEBUG', 'false').lower() != 'true'
 
 # Worker lifecycle settings
 # TEMPORARILY DISABLED: Restarts clear in-memory session dicts
@@ -45,6 +62,10 @@ user = None
 group = None
 tmp_upload_dir = None
 
+# Static file delivery - send_from_directory hands gunicorn a wsgi.file_wrapper,
+# which the sync/gthread workers stream with sendfile(2) (zero-copy, no Python buffers)
+sendfile = True
+
 # SSL (if needed)
 keyfile = None
 certfile = None
@@ -59,7 +80,7 @@ def on_starting(server):
     """Called just before the master process is initialized."""
     server.log.info("🚀 Starting PM Tools Suite")
     server.log.info(f"Worker Class: {worker_class}, Workers: {workers}, Timeout: {timeout}s")
-    server.log.info("✅ Gevent async workers enabled - SSE streaming ready")
+    server.log.info(f"✅ {threads} threads per worker - SSE streaming ready")
 
 def on_reload(server):
     """Called to recycle workers during a reload via SIGHUP."""
@@ -75,10 +96,18 @@ def worker_abort(worker):
 
 def post_fork(server, worker):
     """Called just after a worker has been forked."""
-    server.log.info(f"👶 Worker {worker.pid} spawned (gevent)")
+    server.log.info(f"👶 Worker {worker.pid} spawned ({worker_class})")
+    if preload_app:
+        # The app was imported in the master; its cleanup timer thread did not fork with it
+        from app import start_cleanup_scheduler
+        start_cleanup_scheduler()
 
 def when_ready(server):
     """Called just after the server is started."""
+    if preload_app:
+        # app.py imports HOTDOG lazily; pull it into the master before workers fork
+        # so openai/PyMuPDF are loaded once and shared copy-on-write
+        import services.hotdog  # noqa: F401
     server.log.info("✅ Server is ready")
 
 def worker_exit(server, worker):
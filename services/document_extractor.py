@@ -4,6 +4,7 @@ Handles PDFs, text files, Word documents, and other common formats.
 Uses robust extraction methods with automatic format detection.
 """
 
+import importlib.util
 import logging
 import os
 import mimetypes
@@ -14,6 +15,20 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def _library_available(module_name: str) -> bool:
+    """
+    Check whether a backend is installed without importing it.
+
+    find_spec only consults the import finders, so registering strategies
+    doesn't pay for loading every PDF/DOCX library up front - each strategy
+    imports its library on first use.
+    """
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class DocumentExtractionStrategy(ABC):
     """Abstract base class for document extraction strategies."""
 
@@ -216,8 +231,22 @@ class DocumentExtractorService:
     Uses strategy pattern with automatic format detection and fallback.
     """
 
+    # Page markers in combined text (the analyzer cites pages by these)
+    PDF_PAGE_MARKER = "<PDF pg {}>"
+    PAGE_MARKER = "<Page {}>"
+
     def __init__(self):
         self.strategies = self._initialize_strategies()
+        # Installed libraries can't change at runtime - answer status probes from these
+        self._available_libraries = {
+            file_type: tuple(strategy.name for strategy in strats)
+            for file_type, strats in self.strategies.items()
+            if strats
+        }
+        self._supported_extensions = tuple(
+            ext for file_type, ext in (('pdf', '.pdf'), ('text', '.txt'), ('docx', '.docx'), ('rtf', '.rtf'))
+            if self.strategies.get(file_type)
+        )
 
     def _initialize_strategies(self) -> Dict[str, List[DocumentExtractionStrategy]]:
         """Initialize available extraction strategies organized by file type."""
@@ -229,25 +258,22 @@ class DocumentExtractorService:
         }
 
         # PDF strategies (in order of preference)
-        try:
-            import fitz  # PyMuPDF
+        if _library_available('fitz'):
             strategies['pdf'].append(PyMuPDFStrategy())
             logger.debug("PyMuPDF strategy available")
-        except ImportError:
+        else:
             logger.debug("PyMuPDF not available")
 
-        try:
-            import pdfplumber
+        if _library_available('pdfplumber'):
             strategies['pdf'].append(PDFPlumberStrategy())
             logger.debug("pdfplumber strategy available")
-        except ImportError:
+        else:
             logger.debug("pdfplumber not available")
 
-        try:
-            import PyPDF2
+        if _library_available('PyPDF2'):
             strategies['pdf'].append(PyPDF2Strategy())
             logger.debug("PyPDF2 strategy available")
-        except ImportError:
+        else:
             logger.debug("PyPDF2 not available")
 
         # Text file strategy (always available)
@@ -255,19 +281,17 @@ class DocumentExtractorService:
         logger.debug("TextFile strategy available")
 
         # DOCX strategy
-        try:
-            import docx
+        if _library_available('docx'):
             strategies['docx'].append(DocxStrategy())
             logger.debug("python-docx strategy available")
-        except ImportError:
+        else:
             logger.debug("python-docx not available")
 
         # RTF strategy
-        try:
-            from striprtf.striprtf import rtf_to_text
+        if _library_available('striprtf'):
             strategies['rtf'].append(RTFStrategy())
             logger.debug("striprtf strategy available")
-        except ImportError:
+        else:
             logger.debug("striprtf not available")
 
         # Log available strategies
@@ -365,15 +389,29 @@ class DocumentExtractorService:
         filename = os.path.basename(file_path)
         file_type = self.get_file_type(filename)
         pages = self.extract_text_with_pages(file_path, min_length)
+        return self.combine_pages(pages, file_type)
 
-        # Use appropriate marker based on file type
-        page_marker = "<PDF pg {}>" if file_type == 'pdf' else "<Page {}>"
+    @staticmethod
+    def combine_pages(pages: List[Tuple[int, str]], file_type: Optional[str] = 'pdf') -> str:
+        """
+        Combine already-extracted pages into one text with page markers.
+
+        Callers that need both the page list and the combined text should
+        extract once and call this, instead of parsing the document twice.
+
+        Args:
+            pages: List of tuples (page_number, page_text)
+            file_type: File type from get_file_type() (selects the marker style)
 
-        combined_text = ""
-        for page_num, page_text in pages:
-            combined_text += f"\n\n{page_marker.format(page_num)}\n{page_text}"
+        Returns:
+            Combined text with <PDF pg #> markers (or <Page #> for other formats)
+        """
+        # Use appropriate marker based on file type
+        page_marker = DocumentExtractorService.PDF_PAGE_MARKER if file_type == 'pdf' else DocumentExtractorService.PAGE_MARKER
 
-        return combined_text.strip()
+        return "\n\n".join(
+            f"{page_marker.format(page_num)}\n{page_text}" for page_num, page_text in pages
+        ).strip()
 
     def _clean_text(self, text: str) -> str:
         """
@@ -404,21 +442,8 @@ class DocumentExtractorService:
 
     def get_available_libraries(self) -> Dict[str, List[str]]:
         """Return dictionary of available extraction libraries by file type."""
-        return {
-            file_type: [strategy.name for strategy in strats]
-            for file_type, strats in self.strategies.items()
-            if strats
-        }
+        return {file_type: list(names) for file_type, names in self._available_libraries.items()}
 
     def get_supported_extensions(self) -> List[str]:
         """Return list of supported file extensions."""
-        supported = []
-        if self.strategies.get('pdf'):
-            supported.append('.pdf')
-        if self.strategies.get('text'):
-            supported.append('.txt')
-        if self.strategies.get('docx'):
-            supported.append('.docx')
-        if self.strategies.get('rtf'):
-            supported.append('.rtf')
-        return supported
+        return list(self._supported_extensions)
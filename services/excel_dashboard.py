@@ -11,6 +11,7 @@ import io
 import re
 from datetime import datetime
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
@@ -51,6 +52,29 @@ class ExcelDashboardGenerator:
     DATA_FONT_BOLD = Font(name='Calibri', size=11, bold=True, color="1F2937")
     STAT_LABEL_FONT = Font(name='Calibri', size=11, color="374151")
     STAT_VALUE_FONT = Font(name='Calibri', size=11, bold=True, color="667EEA")
+    SHEET_TITLE_FONT = Font(name='Calibri', size=16, bold=True, color="667EEA")
+    SECTION_HEADER_FONT = Font(name='Calibri', size=13, bold=True, color="FFFFFF")
+    NOTE_FONT = Font(name='Calibri', size=11, italic=True, color="6B7280")
+    NOT_FOUND_FONT = Font(name='Calibri', size=11, italic=True, color="9CA3AF")
+    STATUS_FONT = Font(name='Calibri', size=10, bold=True)
+    FOOTNOTE_YES_FONT = Font(name='Calibri', size=11, bold=True, color=GREEN)
+    FOOTNOTE_NO_FONT = Font(name='Calibri', size=11, bold=True, color=GRAY)
+    NOTES_YES_FONT = Font(name='Calibri', size=10, italic=True, color=PURPLE)
+    NOTES_NO_FONT = Font(name='Calibri', size=10, italic=True, color=GRAY)
+    CHECK_FONT = Font(name='Calibri', size=14, bold=True, color=GREEN)
+    CROSS_FONT = Font(name='Calibri', size=14, bold=True, color=RED)
+    PARTIAL_BANNER_FONT = Font(name='Calibri', size=12, bold=True, color="92400E")
+    PARTIAL_BANNER_FILL = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
+
+    # Alignments
+    ALIGN_CENTER = Alignment(horizontal='center', vertical='center')
+    ALIGN_TITLE = Alignment(horizontal='left', vertical='center')
+    ALIGN_SECTION = Alignment(horizontal='left', vertical='center', indent=1)
+    ALIGN_HEADER = Alignment(horizontal='center', vertical='center')
+    ALIGN_HEADER_WRAP = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    ALIGN_WRAP_TOP = Alignment(wrap_text=True, vertical='top')
+    ALIGN_DATA_LEFT = Alignment(horizontal='left', vertical='top', wrap_text=True)
+    ALIGN_DATA_CENTER = Alignment(horizontal='center', vertical='top', wrap_text=True)
 
     # Borders
     BORDER_THIN = Border(
@@ -77,25 +101,48 @@ class ExcelDashboardGenerator:
     def __init__(self, analysis_result, is_partial=False):
         self.result = analysis_result
         self.is_partial = is_partial
-        self.wb = Workbook()
+        # Write-only: rows stream into the sheet XML as they are appended
+        # instead of living as Cell objects until save()
+        self.wb = Workbook(write_only=True)
         self.footnotes = self._collect_footnotes()
         self.key_requirements = self._extract_key_requirements()
 
-    def generate(self):
-        """Generate complete 4-sheet report package"""
-        if 'Sheet' in self.wb.sheetnames:
-            del self.wb['Sheet']
+    def generate(self, dest=None):
+        """
+        Generate complete 4-sheet report package.
 
+        With `dest` (a path or a seekable binary file) the workbook is written
+        straight there and `dest` returned; otherwise it comes back as a
+        rewound BytesIO.
+        """
         self._create_executive_summary()      # Sheet 1: Executive Summary
         self._create_detailed_results()       # Sheet 2: Detailed Results
         self._create_by_section()             # Sheet 3: By Section
         self._create_footnotes_sheet()        # Sheet 4: Footnotes
 
+        if dest is not None:
+            self.wb.save(dest)
+            return dest
+
         output = io.BytesIO()
         self.wb.save(output)
         output.seek(0)
         return output
 
+    @staticmethod
+    def _cell(ws, value=None, font=None, fill=None, alignment=None, border=None):
+        """One styled write-only cell (styles must be set before the row is appended)."""
+        cell = WriteOnlyCell(ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if border is not None:
+            cell.border = border
+        return cell
+
     def _collect_footnotes(self):
         """Collect all footnotes from the analysis"""
         footnotes = []
@@ -174,38 +221,38 @@ class ExcelDashboardGenerator:
 
     def _create_executive_summary(self):
         """Sheet 1: Executive Summary - Analysis statistics and key requirements"""
-        ws = self.wb.create_sheet('Executive Summary', 0)
+        ws = self.wb.create_sheet('Executive Summary')
         stats = self._calculate_statistics()
+        cell = self._cell
+
+        # Column widths (write-only sheets emit them before the first row)
+        ws.column_dimensions['A'].width = 25
+        ws.column_dimensions['B'].width = 35
+        ws.column_dimensions['C'].width = 35
 
         # === TITLE BANNER ===
-        ws.merge_cells('A1:C2')
-        title_cell = ws['A1']
-        title_cell.value = 'MUNICIPAL PIPE TOOL - ANALYSIS REPORT'
-        title_cell.font = self.TITLE_FONT
-        title_cell.fill = self.TITLE_FILL
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
+        ws.merged_cells.add('A1:C2')
         ws.row_dimensions[1].height = 25
         ws.row_dimensions[2].height = 25
+        ws.append([cell(ws, 'MUNICIPAL PIPE TOOL - ANALYSIS REPORT', self.TITLE_FONT, self.TITLE_FILL, self.ALIGN_CENTER)])
+        ws.append([])
+        ws.append([])
 
         row = 4
 
         # === PARTIAL RESULTS BANNER ===
         if self.is_partial:
-            ws.merge_cells(f'A{row}:C{row}')
-            ws[f'A{row}'] = '⚠ PARTIAL RESULTS - Analysis was stopped before completion'
-            ws[f'A{row}'].font = Font(name='Calibri', size=12, bold=True, color="92400E")
-            ws[f'A{row}'].fill = PatternFill(start_color="FEF3C7", end_color="FEF3C7", fill_type="solid")
-            ws[f'A{row}'].alignment = Alignment(horizontal='center', vertical='center')
+            ws.merged_cells.add(f'A{row}:C{row}')
             ws.row_dimensions[row].height = 30
+            ws.append([cell(ws, '⚠ PARTIAL RESULTS - Analysis was stopped before completion',
+                            self.PARTIAL_BANNER_FONT, self.PARTIAL_BANNER_FILL, self.ALIGN_CENTER)])
+            ws.append([])
             row += 2
 
         # === ANALYSIS STATISTICS SECTION ===
-        ws.merge_cells(f'A{row}:C{row}')
-        ws[f'A{row}'] = 'Analysis Statistics'
-        ws[f'A{row}'].font = self.SECTION_FONT
-        ws[f'A{row}'].fill = self.SECTION_FILL
-        ws[f'A{row}'].alignment = Alignment(horizontal='left', vertical='center', indent=1)
+        ws.merged_cells.add(f'A{row}:C{row}')
         ws.row_dimensions[row].height = 28
+        ws.append([cell(ws, 'Analysis Statistics', self.SECTION_FONT, self.SECTION_FILL, self.ALIGN_SECTION)])
         row += 1
 
         # Statistics rows
@@ -218,30 +265,24 @@ class ExcelDashboardGenerator:
         ]
 
         for idx, (label, value) in enumerate(stat_data):
-            is_alt = idx % 2 == 1
-
-            ws.cell(row, 1, label).font = self.STAT_LABEL_FONT
-            ws.cell(row, 2, value).font = self.STAT_VALUE_FONT
-
-            for col in range(1, 4):
-                cell = ws.cell(row, col)
-                cell.border = self.BORDER_THIN
-                if is_alt:
-                    cell.fill = self.ALT_ROW_FILL
+            fill = self.ALT_ROW_FILL if idx % 2 == 1 else None
 
             ws.row_dimensions[row].height = 22
+            ws.append([
+                cell(ws, label, self.STAT_LABEL_FONT, fill, border=self.BORDER_THIN),
+                cell(ws, value, self.STAT_VALUE_FONT, fill, border=self.BORDER_THIN),
+                cell(ws, None, fill=fill, border=self.BORDER_THIN),
+            ])
             row += 1
 
+        ws.append([])
         row += 1
 
         # === KEY PROJECT REQUIREMENTS SECTION ===
         if self.key_requirements:
-            ws.merge_cells(f'A{row}:C{row}')
-            ws[f'A{row}'] = 'Key Project Requirements'
-            ws[f'A{row}'].font = self.SECTION_FONT
-            ws[f'A{row}'].fill = self.SECTION_FILL
-            ws[f'A{row}'].alignment = Alignment(horizontal='left', vertical='center', indent=1)
+            ws.merged_cells.add(f'A{row}:C{row}')
             ws.row_dimensions[row].height = 28
+            ws.append([cell(ws, 'Key Project Requirements', self.SECTION_FONT, self.SECTION_FILL, self.ALIGN_SECTION)])
             row += 1
 
             # Sort requirements by a preferred order
@@ -258,18 +299,7 @@ class ExcelDashboardGenerator:
                     sorted_reqs.append((key + ':', value))
 
             for idx, (label, value) in enumerate(sorted_reqs):
-                is_alt = idx % 2 == 1
-
-                ws.cell(row, 1, label).font = self.STAT_LABEL_FONT
-                ws.merge_cells(f'B{row}:C{row}')
-                ws.cell(row, 2, value).font = self.DATA_FONT
-                ws.cell(row, 2).alignment = Alignment(wrap_text=True, vertical='top')
-
-                for col in range(1, 4):
-                    cell = ws.cell(row, col)
-                    cell.border = self.BORDER_THIN
-                    if is_alt:
-                        cell.fill = self.ALT_ROW_FILL
+                fill = self.ALT_ROW_FILL if idx % 2 == 1 else None
 
                 # Calculate dynamic row height based on content length
                 # Columns B+C combined width is ~70 chars, each line ~15px height
@@ -277,40 +307,38 @@ class ExcelDashboardGenerator:
                 num_lines = max(1, (len(value) // chars_per_line) + 1)
                 row_height = max(25, num_lines * 18)  # Minimum 25, 18px per line
                 ws.row_dimensions[row].height = row_height
+
+                ws.merged_cells.add(f'B{row}:C{row}')
+                ws.append([
+                    cell(ws, label, self.STAT_LABEL_FONT, fill, border=self.BORDER_THIN),
+                    cell(ws, value, self.DATA_FONT, fill, self.ALIGN_WRAP_TOP, self.BORDER_THIN),
+                    cell(ws, None, fill=fill, border=self.BORDER_THIN),
+                ])
                 row += 1
         else:
-            row += 1
-            ws[f'A{row}'] = 'Key project requirements will appear here when extracted from the analysis.'
-            ws[f'A{row}'].font = Font(name='Calibri', size=11, italic=True, color="6B7280")
-
-        # Column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 35
-        ws.column_dimensions['C'].width = 35
+            ws.append([])
+            ws.append([cell(ws, 'Key project requirements will appear here when extracted from the analysis.',
+                            self.NOTE_FONT)])
 
     def _create_detailed_results(self):
         """Sheet 2: Detailed Results - All Q&A in unified professional table"""
         ws = self.wb.create_sheet('Detailed Results')
+        cell = self._cell
 
-        ws.merge_cells('A1:G1')
-        ws['A1'] = 'COMPLETE ANALYSIS RESULTS'
-        ws['A1'].font = Font(name='Calibri', size=16, bold=True, color="667EEA")
-        ws['A1'].alignment = Alignment(horizontal='left', vertical='center')
-        ws.row_dimensions[1].height = 30
-
-        row = 2
         headers = ['#', 'Section', 'Question', 'Answer', 'PDF Pages', 'Footnote', 'Status']
         widths = [5, 25, 45, 60, 12, 8, 11]
-
-        for col, (header, width) in enumerate(zip(headers, widths), start=1):
-            cell = ws.cell(row, col, header)
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = self.BORDER_THIN
+        for col, width in enumerate(widths, start=1):
             ws.column_dimensions[get_column_letter(col)].width = width
 
-        ws.row_dimensions[row].height = 25
+        ws.merged_cells.add('A1:G1')
+        ws.row_dimensions[1].height = 30
+        ws.append([cell(ws, 'COMPLETE ANALYSIS RESULTS', self.SHEET_TITLE_FONT, alignment=self.ALIGN_TITLE)])
+
+        ws.row_dimensions[2].height = 25
+        ws.append([
+            cell(ws, header, self.HEADER_FONT, self.HEADER_FILL, self.ALIGN_HEADER_WRAP, self.BORDER_THIN)
+            for header in headers
+        ])
 
         row = 3
         question_num = 1
@@ -327,58 +355,38 @@ class ExcelDashboardGenerator:
                 has_footnote = bool(q.get('footnote'))
 
                 is_section_start = section_name != current_section
-                is_alt_row = question_num % 2 == 0
-
-                ws.cell(row, 1, question_num).font = self.DATA_FONT
-                ws.cell(row, 1).alignment = Alignment(horizontal='center', vertical='top')
-
-                section_cell = ws.cell(row, 2, section_name if is_section_start else '')
                 if is_section_start:
-                    section_cell.font = self.DATA_FONT_BOLD
                     current_section = section_name
-                else:
-                    section_cell.font = self.DATA_FONT
-
-                ws.cell(row, 3, q.get('question', '')).font = self.DATA_FONT
-
-                answer_cell = ws.cell(row, 4, answer_text if has_answer else 'Not found in document')
-                if has_answer:
-                    answer_cell.font = self.DATA_FONT
-                else:
-                    answer_cell.font = Font(name='Calibri', size=11, italic=True, color="9CA3AF")
-
-                pages_cell = ws.cell(row, 5, pages_str)
-                pages_cell.font = self.DATA_FONT_BOLD if has_answer else self.DATA_FONT
-                pages_cell.alignment = Alignment(horizontal='center', vertical='top')
-
-                fn_cell = ws.cell(row, 6, '✓' if has_footnote else '-')
-                fn_cell.font = Font(name='Calibri', size=11, bold=True, color=self.GREEN if has_footnote else self.GRAY)
-                fn_cell.alignment = Alignment(horizontal='center', vertical='top')
-
-                status_cell = ws.cell(row, 7, 'Found' if has_answer else 'Not Found')
-                status_cell.font = Font(name='Calibri', size=10, bold=True)
-                status_cell.fill = self.ANSWERED_FILL if has_answer else self.UNANSWERED_FILL
-                status_cell.alignment = Alignment(horizontal='center', vertical='top')
-
-                for col in range(1, 8):
-                    cell = ws.cell(row, col)
-                    cell.border = self.BORDER_THIN
-                    if col not in [6, 7]:
-                        if is_alt_row:
-                            cell.fill = self.ALT_ROW_FILL
-                    cell.alignment = Alignment(
-                        horizontal='left' if col in [2, 3, 4] else 'center',
-                        vertical='top',
-                        wrap_text=True
-                    )
+                fill = self.ALT_ROW_FILL if question_num % 2 == 0 else None
+                left, center, border = self.ALIGN_DATA_LEFT, self.ALIGN_DATA_CENTER, self.BORDER_THIN
 
                 ws.row_dimensions[row].height = 55
+                ws.append([
+                    cell(ws, question_num, self.DATA_FONT, fill, center, border),
+                    cell(ws, section_name if is_section_start else '',
+                         self.DATA_FONT_BOLD if is_section_start else self.DATA_FONT, fill, left, border),
+                    cell(ws, q.get('question', ''), self.DATA_FONT, fill, left, border),
+                    cell(ws, answer_text if has_answer else 'Not found in document',
+                         self.DATA_FONT if has_answer else self.NOT_FOUND_FONT, fill, left, border),
+                    cell(ws, pages_str, self.DATA_FONT_BOLD if has_answer else self.DATA_FONT, fill, center, border),
+                    cell(ws, '✓' if has_footnote else '-',
+                         self.FOOTNOTE_YES_FONT if has_footnote else self.FOOTNOTE_NO_FONT, None, center, border),
+                    cell(ws, 'Found' if has_answer else 'Not Found', self.STATUS_FONT,
+                         self.ANSWERED_FILL if has_answer else self.UNANSWERED_FILL, center, border),
+                ])
                 row += 1
                 question_num += 1
 
     def _create_by_section(self):
         """Sheet 3: By Section - Questions grouped with section breakdown"""
         ws = self.wb.create_sheet('By Section')
+        cell = self._cell
+
+        for col, width in zip('ABCDEF', (5, 45, 60, 12, 14, 10)):
+            ws.column_dimensions[col].width = width
+
+        headers = ['#', 'Question', 'Answer', 'PDF Pages', 'Notes', 'Status']
+        left, center, border = self.ALIGN_DATA_LEFT, self.ALIGN_DATA_CENTER, self.BORDER_THIN
 
         row = 1
         for section_idx, section in enumerate(self.result.get('sections', [])):
@@ -387,24 +395,17 @@ class ExcelDashboardGenerator:
             total = len(questions)
             rate = (answered / total * 100) if total > 0 else 0
 
-            ws.merge_cells(f'A{row}:F{row}')
-            header_cell = ws[f'A{row}']
-            header_text = f"{section.get('section_name', 'Unknown Section').upper()}  ({answered}/{total} answered - {rate:.0f}%)"
-            header_cell.value = header_text
-            header_cell.font = Font(name='Calibri', size=13, bold=True, color="FFFFFF")
-            header_cell.fill = self.HEADER_FILL
-            header_cell.alignment = Alignment(horizontal='left', vertical='center', indent=1)
+            ws.merged_cells.add(f'A{row}:F{row}')
             ws.row_dimensions[row].height = 32
+            header_text = f"{section.get('section_name', 'Unknown Section').upper()}  ({answered}/{total} answered - {rate:.0f}%)"
+            ws.append([cell(ws, header_text, self.SECTION_HEADER_FONT, self.HEADER_FILL, self.ALIGN_SECTION)])
             row += 1
 
-            headers = ['#', 'Question', 'Answer', 'PDF Pages', 'Notes', 'Status']
-            for col, header in enumerate(headers, start=1):
-                cell = ws.cell(row, col, header)
-                cell.font = self.SUBHEADER_FONT
-                cell.fill = self.SUBHEADER_FILL
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = self.BORDER_THIN
             ws.row_dimensions[row].height = 22
+            ws.append([
+                cell(ws, header, self.SUBHEADER_FONT, self.SUBHEADER_FILL, self.ALIGN_HEADER, border)
+                for header in headers
+            ])
             row += 1
 
             for idx, q in enumerate(questions, start=1):
@@ -412,114 +413,72 @@ class ExcelDashboardGenerator:
                 has_answer = bool(answer_text and answer_text.strip())
                 pages = q.get('page_citations', [])
                 pages_str = ', '.join(map(str, pages)) if pages else '-'
-                is_alt = idx % 2 == 0
-
-                ws.cell(row, 1, idx).font = self.DATA_FONT
-                ws.cell(row, 1).alignment = Alignment(horizontal='center', vertical='top')
-
-                ws.cell(row, 2, q.get('question', '')).font = self.DATA_FONT
-
-                answer_cell = ws.cell(row, 3, answer_text if has_answer else 'Not found in document')
-                if has_answer:
-                    answer_cell.font = self.DATA_FONT
-                else:
-                    answer_cell.font = Font(name='Calibri', size=11, italic=True, color="9CA3AF")
-
-                ws.cell(row, 4, pages_str).font = self.DATA_FONT_BOLD if has_answer else self.DATA_FONT
-                ws.cell(row, 4).alignment = Alignment(horizontal='center', vertical='top')
-
                 has_footnote = bool(q.get('footnote'))
-                notes_cell = ws.cell(row, 5, 'See footnotes' if has_footnote else '-')
-                notes_cell.font = Font(name='Calibri', size=10, italic=True, color=self.PURPLE if has_footnote else self.GRAY)
-                notes_cell.alignment = Alignment(horizontal='center', vertical='top')
-
-                status_cell = ws.cell(row, 6, '✓' if has_answer else '✗')
-                status_cell.font = Font(name='Calibri', size=14, bold=True, color=self.GREEN if has_answer else self.RED)
-                status_cell.fill = self.ANSWERED_FILL if has_answer else self.UNANSWERED_FILL
-                status_cell.alignment = Alignment(horizontal='center', vertical='top')
-
-                for col in range(1, 7):
-                    cell = ws.cell(row, col)
-                    cell.border = self.BORDER_THIN
-                    if col != 6 and is_alt:
-                        cell.fill = self.ALT_ROW_FILL
-                    cell.alignment = Alignment(
-                        horizontal='left' if col in [2, 3] else 'center',
-                        vertical='top',
-                        wrap_text=True
-                    )
+                fill = self.ALT_ROW_FILL if idx % 2 == 0 else None
 
                 ws.row_dimensions[row].height = 50
+                ws.append([
+                    cell(ws, idx, self.DATA_FONT, fill, center, border),
+                    cell(ws, q.get('question', ''), self.DATA_FONT, fill, left, border),
+                    cell(ws, answer_text if has_answer else 'Not found in document',
+                         self.DATA_FONT if has_answer else self.NOT_FOUND_FONT, fill, left, border),
+                    cell(ws, pages_str, self.DATA_FONT_BOLD if has_answer else self.DATA_FONT, fill, center, border),
+                    cell(ws, 'See footnotes' if has_footnote else '-',
+                         self.NOTES_YES_FONT if has_footnote else self.NOTES_NO_FONT, fill, center, border),
+                    cell(ws, '✓' if has_answer else '✗',
+                         self.CHECK_FONT if has_answer else self.CROSS_FONT,
+                         self.ANSWERED_FILL if has_answer else self.UNANSWERED_FILL, center, border),
+                ])
                 row += 1
 
+            ws.append([])
             row += 1
 
-        ws.column_dimensions['A'].width = 5
-        ws.column_dimensions['B'].width = 45
-        ws.column_dimensions['C'].width = 60
-        ws.column_dimensions['D'].width = 12
-        ws.column_dimensions['E'].width = 14
-        ws.column_dimensions['F'].width = 10
-
     def _create_footnotes_sheet(self):
         """Sheet 4: Footnotes - All citations and contextual notes"""
         ws = self.wb.create_sheet('Footnotes')
+        cell = self._cell
 
-        ws.merge_cells('A1:E1')
-        ws['A1'] = 'FOOTNOTES & CITATIONS'
-        ws['A1'].font = Font(name='Calibri', size=16, bold=True, color="667EEA")
-        ws['A1'].alignment = Alignment(horizontal='left', vertical='center')
+        headers = ['#', 'Section', 'Related Question', 'Footnote/Citation', 'PDF Pages']
+        widths = [5, 25, 40, 55, 12]
+        if self.footnotes:
+            for col, width in enumerate(widths, start=1):
+                ws.column_dimensions[get_column_letter(col)].width = width
+
+        ws.merged_cells.add('A1:E1')
         ws.row_dimensions[1].height = 30
+        ws.append([cell(ws, 'FOOTNOTES & CITATIONS', self.SHEET_TITLE_FONT, alignment=self.ALIGN_TITLE)])
 
         if not self.footnotes:
-            ws['A3'] = 'No footnotes were generated during this analysis.'
-            ws['A3'].font = Font(name='Calibri', size=11, italic=True, color="6B7280")
+            ws.append([])
+            ws.append([cell(ws, 'No footnotes were generated during this analysis.', self.NOTE_FONT)])
             return
 
-        ws['A2'] = f'{len(self.footnotes)} footnotes collected from analysis'
-        ws['A2'].font = Font(name='Calibri', size=11, italic=True, color="6B7280")
+        ws.append([cell(ws, f'{len(self.footnotes)} footnotes collected from analysis', self.NOTE_FONT)])
+        ws.append([])
 
         row = 4
-        headers = ['#', 'Section', 'Related Question', 'Footnote/Citation', 'PDF Pages']
-        widths = [5, 25, 40, 55, 12]
-
-        for col, (header, width) in enumerate(zip(headers, widths), start=1):
-            cell = ws.cell(row, col, header)
-            cell.font = self.HEADER_FONT
-            cell.fill = self.HEADER_FILL
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = self.BORDER_THIN
-            ws.column_dimensions[get_column_letter(col)].width = width
-
         ws.row_dimensions[row].height = 25
+        ws.append([
+            cell(ws, header, self.HEADER_FONT, self.HEADER_FILL, self.ALIGN_HEADER_WRAP, self.BORDER_THIN)
+            for header in headers
+        ])
 
+        left, center, border = self.ALIGN_DATA_LEFT, self.ALIGN_DATA_CENTER, self.BORDER_THIN
         for fn in self.footnotes:
             row += 1
-            is_alt = fn['number'] % 2 == 0
-
-            ws.cell(row, 1, fn['number']).font = self.DATA_FONT_BOLD
-            ws.cell(row, 1).alignment = Alignment(horizontal='center', vertical='top')
-
-            ws.cell(row, 2, fn['section']).font = self.DATA_FONT
-            ws.cell(row, 3, fn['question'][:100] + '...' if len(fn['question']) > 100 else fn['question']).font = self.DATA_FONT
-            ws.cell(row, 4, fn['footnote']).font = self.DATA_FONT
-
+            fill = self.ALT_ROW_FILL if fn['number'] % 2 == 0 else None
+            question = fn['question'][:100] + '...' if len(fn['question']) > 100 else fn['question']
             pages_str = ', '.join(map(str, fn['pages'])) if fn['pages'] else '-'
-            ws.cell(row, 5, pages_str).font = self.DATA_FONT_BOLD
-            ws.cell(row, 5).alignment = Alignment(horizontal='center', vertical='top')
-
-            for col in range(1, 6):
-                cell = ws.cell(row, col)
-                cell.border = self.BORDER_THIN
-                if is_alt:
-                    cell.fill = self.ALT_ROW_FILL
-                cell.alignment = Alignment(
-                    horizontal='left' if col in [2, 3, 4] else 'center',
-                    vertical='top',
-                    wrap_text=True
-                )
 
             ws.row_dimensions[row].height = 45
+            ws.append([
+                cell(ws, fn['number'], self.DATA_FONT_BOLD, fill, center, border),
+                cell(ws, fn['section'], self.DATA_FONT, fill, left, border),
+                cell(ws, question, self.DATA_FONT, fill, left, border),
+                cell(ws, fn['footnote'], self.DATA_FONT, fill, left, border),
+                cell(ws, pages_str, self.DATA_FONT_BOLD, fill, center, border),
+            ])
 
     def _get_timestamp(self):
         """Get formatted timestamp"""
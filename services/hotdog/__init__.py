@@ -26,7 +26,8 @@ from .layers import (
     DocumentIngestionLayer,
     ConfigurationLoader,
     ExpertPersonaGenerator,
-    TokenBudgetManager
+    TokenBudgetManager,
+    record_content_hash
 )
 from .multi_expert_processor import MultiExpertProcessor
 from .smart_accumulator import SmartAccumulator
@@ -41,5 +42,6 @@ __all__ = [
     'MultiExpertProcessor',
     'SmartAccumulator',
     'TokenBudgetManager',
-    'OutputCompiler'
+    'OutputCompiler',
+    'record_content_hash'
 ]
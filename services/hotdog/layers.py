@@ -21,6 +21,12 @@ import json
 import hashlib
 import logging
 import asyncio
+import threading
+import time
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
@@ -45,6 +51,173 @@ logger = logging.getLogger(__name__)
 # LAYER 0: DOCUMENT INGESTION
 # ============================================================================
 
+# Extracted pages keyed by SHA-256 of the file contents. Re-uploading the same
+# spec during iterative analysis skips the fitz pass entirely. PageData is
+# frozen, so cached lists can be shared safely between analyses.
+EXTRACTION_CACHE_SIZE = int(os.getenv('EXTRACTION_CACHE_SIZE', 32))
+_HASH_CHUNK_SIZE = 1024 * 1024
+_extraction_cache: "OrderedDict[str, List[PageData]]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+
+
+# fitz extraction is CPU-bound and holds the GIL; run it in child processes so
+# the gthread worker keeps serving SSE/polling while a large spec is parsed.
+# EXTRACTION_PROCESSES=0 extracts inline in the calling thread.
+EXTRACTION_PROCESSES = int(os.getenv('EXTRACTION_PROCESSES', min(2, os.cpu_count() or 1)))
+# Wall-clock budget for one document (all page ranges together). A PDF that
+# blows it is treated as hostile/corrupt and its pool processes are killed.
+EXTRACTION_TIMEOUT = int(os.getenv('EXTRACTION_TIMEOUT', 120))  # seconds
+PARALLEL_EXTRACTION_MIN_PAGES = int(os.getenv('PARALLEL_EXTRACTION_MIN_PAGES', 20))
+_extraction_executor: Optional[ProcessPoolExecutor] = None
+_extraction_executor_lock = threading.Lock()
+
+
+def _extraction_mp_context():
+    """
+    Start context for the extraction pool. The parent is multithreaded, so
+    plain fork is out; a forkserver that has already imported this module (and
+    with it fitz) forks ready-to-run children that share those pages
+    copy-on-write, instead of each spawn child re-importing PyMuPDF.
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    ctx = multiprocessing.get_context('forkserver')
+    ctx.set_forkserver_preload([__name__])
+    return ctx
+
+
+def _get_extraction_executor() -> Optional[ProcessPoolExecutor]:
+    """Create the extraction pool on first use (never pre-fork: no fds/threads in the gunicorn master)."""
+    global _extraction_executor
+    if EXTRACTION_PROCESSES <= 0:
+        return None
+    with _extraction_executor_lock:
+        if _extraction_executor is None:
+            _extraction_executor = ProcessPoolExecutor(
+                max_workers=EXTRACTION_PROCESSES,
+                mp_context=_extraction_mp_context()
+            )
+        return _extraction_executor
+
+
+def _reset_extraction_executor(terminate: bool = False):
+    """
+    Drop a broken pool so the next extraction starts a fresh one. With
+    terminate=True the pool's processes are killed first - shutdown() alone
+    leaves a process grinding on a runaway PDF.
+    """
+    global _extraction_executor
+    with _extraction_executor_lock:
+        executor, _extraction_executor = _extraction_executor, None
+    if executor is None:
+        return
+    if terminate:
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_page_texts(pdf_path: str, start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """
+    Run the fitz pass over pages [start, stop) (module-level so it can be
+    pickled into the pool; each process reopens the file by path).
+
+    Returns bare strings: they cross the process boundary far cheaper than
+    PageData instances, which the parent builds in _to_page_data.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        stop = len(doc) if stop is None else min(stop, len(doc))
+        return [doc[page_num].get_text() for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _to_page_data(texts: List[str], start: int = 0) -> List[PageData]:
+    """PageData for consecutive pages whose first 0-indexed page is `start`."""
+    return [
+        PageData(
+            page_num=page_num,  # 1-indexed for user display
+            text=text,
+            char_count=len(text),
+            has_content=len(text.strip()) > 50
+        )
+        for page_num, text in enumerate(texts, start=start + 1)
+    ]
+
+
+def _extract_pdf_pages(pdf_path: str) -> List[PageData]:
+    """Whole document, in-process."""
+    return _to_page_data(_extract_page_texts(pdf_path))
+
+
+def _pdf_page_count(pdf_path: str) -> int:
+    """Page count only (fitz reads the xref, not page content)."""
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
+
+
+def _extract_pdf_pages_parallel(executor: ProcessPoolExecutor, pdf_path: str) -> List[PageData]:
+    """
+    Split a large PDF into contiguous page ranges, one per pool process, and
+    stitch the results back together in page order.
+
+    Small documents go to a single process - spreading a handful of pages
+    costs more in IPC and re-opening than it saves.
+    """
+    deadline = time.monotonic() + EXTRACTION_TIMEOUT
+    page_count = _pdf_page_count(pdf_path)
+    if EXTRACTION_PROCESSES < 2 or page_count < PARALLEL_EXTRACTION_MIN_PAGES:
+        return _to_page_data(executor.submit(_extract_page_texts, pdf_path).result(timeout=EXTRACTION_TIMEOUT))
+
+    chunk = -(-page_count // EXTRACTION_PROCESSES)  # ceil division
+    futures = [
+        executor.submit(_extract_page_texts, pdf_path, start, start + chunk)
+        for start in range(0, page_count, chunk)
+    ]
+    texts = []
+    for future in futures:  # submission order == page order
+        # One shared deadline - N ranges must not stretch the budget to N x timeout
+        texts.extend(future.result(timeout=max(0.0, deadline - time.monotonic())))
+    return _to_page_data(texts)
+
+
+def _file_sha256(path: str) -> str:
+    """Hash a file in 1MiB chunks (hashing is far cheaper than extraction)."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# Digests computed while an upload was being written, keyed by path and
+# checked against (size, mtime_ns) so a replaced file is never trusted.
+# Saves extract_pdf a full read of the file just to key the cache.
+_KNOWN_HASHES_SIZE = 256
+_known_hashes: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+
+
+def record_content_hash(path: str, digest: str) -> None:
+    """Remember the SHA-256 of a file the caller has just written."""
+    st = os.stat(path)
+    with _extraction_cache_lock:
+        _known_hashes[path] = (st.st_size, st.st_mtime_ns, digest)
+        _known_hashes.move_to_end(path)
+        while len(_known_hashes) > _KNOWN_HASHES_SIZE:
+            _known_hashes.popitem(last=False)
+
+
+def _content_hash(path: str) -> str:
+    """Recorded digest if the file is unchanged since upload, else hash it."""
+    st = os.stat(path)
+    with _extraction_cache_lock:
+        known = _known_hashes.get(path)
+    if known is not None and known[:2] == (st.st_size, st.st_mtime_ns):
+        return known[2]
+    return _file_sha256(path)
+
+
 class DocumentIngestionLayer:
     """
     Layer 0: Extract text from PDF with perfect page number preservation.
@@ -84,34 +257,44 @@ class DocumentIngestionLayer:
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        try:
-            pages = []
-            doc = fitz.open(pdf_path)
-
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-
-                page_data = PageData(
-                    page_num=page_num + 1,  # 1-indexed for user display
-                    text=text,
-                    char_count=len(text),
-                    has_content=len(text.strip()) > 50
-                )
-                pages.append(page_data)
+        content_hash = _content_hash(pdf_path)
+        with _extraction_cache_lock:
+            pages = _extraction_cache.get(content_hash)
+            if pages is not None:
+                _extraction_cache.move_to_end(content_hash)
 
-            doc.close()
+        if pages is not None:
+            logger.info(f"♻️  Reusing cached extraction for {os.path.basename(pdf_path)} ({content_hash[:12]})")
+            return list(pages), self._build_metadata(pdf_path, pages, content_hash)
+
+        try:
+            executor = _get_extraction_executor()
+            if executor is not None:
+                try:
+                    pages = _extract_pdf_pages_parallel(executor, pdf_path)
+                except BrokenProcessPool:
+                    logger.warning("⚠️  Extraction pool died - retrying in-process")
+                    _reset_extraction_executor()
+                    pages = _extract_pdf_pages(pdf_path)
+                except FuturesTimeoutError:
+                    # No in-process retry: that would pin a request thread on the same PDF
+                    _reset_extraction_executor(terminate=True)
+                    raise ValueError(
+                        f"PDF too complex - extraction exceeded {EXTRACTION_TIMEOUT}s"
+                    ) from None
+            else:
+                pages = _extract_pdf_pages(pdf_path)
 
             if not pages:
                 raise ValueError(f"PDF has no pages: {pdf_path}")
 
-            metadata = {
-                'total_pages': len(pages),
-                'total_chars': sum(p.char_count for p in pages),
-                'file_name': os.path.basename(pdf_path),
-                'extraction_time': datetime.now().isoformat(),
-                'blank_pages': sum(1 for p in pages if not p.has_content)
-            }
+            if EXTRACTION_CACHE_SIZE > 0:
+                with _extraction_cache_lock:
+                    _extraction_cache[content_hash] = list(pages)
+                    while len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+                        _extraction_cache.popitem(last=False)
+
+            metadata = self._build_metadata(pdf_path, pages, content_hash)
 
             logger.info(f"✅ Extracted {len(pages)} pages from {metadata['file_name']}")
             if metadata['blank_pages'] > 0:
@@ -123,6 +306,22 @@ class DocumentIngestionLayer:
             logger.error(f"❌ PDF extraction failed: {e}")
             raise ValueError(f"Failed to extract PDF: {e}")
 
+    @staticmethod
+    def _build_metadata(pdf_path: str, pages: List[PageData], content_hash: str) -> Dict:
+        """Per-call metadata (file name and time differ even when pages are cached)."""
+        total_chars = blank_pages = 0
+        for p in pages:  # one pass for both totals
+            total_chars += p.char_count
+            blank_pages += not p.has_content
+        return {
+            'total_pages': len(pages),
+            'total_chars': total_chars,
+            'file_name': os.path.basename(pdf_path),
+            'extraction_time': datetime.now().isoformat(),
+            'blank_pages': blank_pages,
+            'content_hash': content_hash
+        }
+
     def create_windows(self, pages: List[PageData], window_size: int = 3) -> List[WindowContext]:
         """
         Create 3-page windows from extracted pages.
@@ -180,7 +180,9 @@ class HotdogOrchestrator:
             logger.info("📄 Layer 0: Document Ingestion")
             self._emit_progress('layer_0_start', {'layer': 'Document Ingestion'})
 
-            pages, doc_metadata = self.layer0_ingestion.extract_pdf(pdf_path)
+            # Blocking PDF work goes to a worker thread so it doesn't stall the
+            # event loop other analyses share
+            pages, doc_metadata = await asyncio.to_thread(self.layer0_ingestion.extract_pdf, pdf_path)
             windows = self.layer0_ingestion.create_windows(pages, window_size=3)
 
             logger.info(f"  ✅ Extracted {len(pages)} pages into {len(windows)} windows")
@@ -4,6 +4,7 @@ Handles all PDF text extraction logic with multiple library fallbacks.
 Enhanced with page number preservation for CIPP analysis.
 """
 
+import importlib.util
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, List, Tuple
@@ -12,6 +13,14 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def _library_available(module_name: str) -> bool:
+    """True if the module is installed (find_spec - nothing is imported or executed)."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
 class PDFExtractionStrategy(ABC):
     """Abstract base class for PDF extraction strategies (Strategy Pattern)."""
 
@@ -124,31 +133,31 @@ class PDFExtractorService:
 
     def __init__(self):
         self.strategies = self._initialize_strategies()
+        # Installed libraries can't change at runtime - answer status probes from this
+        self._available_libraries = tuple(strategy.name for strategy in self.strategies)
 
     def _initialize_strategies(self) -> List[PDFExtractionStrategy]:
         """Initialize available PDF extraction strategies based on installed libraries."""
         strategies = []
 
-        # Try to import and register each strategy (in order of preference)
-        try:
-            import pdfplumber
+        # Register each strategy whose library is installed (in order of preference);
+        # the libraries themselves are imported lazily inside the strategies
+        if _library_available('pdfplumber'):
             strategies.append(PDFPlumberStrategy())
             logger.debug("pdfplumber strategy available")
-        except ImportError:
+        else:
             logger.debug("pdfplumber not available")
 
-        try:
-            import PyPDF2
+        if _library_available('PyPDF2'):
             strategies.append(PyPDF2Strategy())
             logger.debug("PyPDF2 strategy available")
-        except ImportError:
+        else:
             logger.debug("PyPDF2 not available")
 
-        try:
-            import pdfminer
+        if _library_available('pdfminer'):
             strategies.append(PDFMinerStrategy())
             logger.debug("pdfminer strategy available")
-        except ImportError:
+        else:
             logger.debug("pdfminer not available")
 
         if not strategies:
@@ -212,12 +221,25 @@ class PDFExtractorService:
             Exception: If all extraction methods fail
         """
         pages = self.extract_text_with_pages(pdf_path, min_length)
+        return self.combine_pages(pages)
+
+    @staticmethod
+    def combine_pages(pages: List[Tuple[int, str]]) -> str:
+        """
+        Combine already-extracted pages into one text with page markers.
+
+        Callers that need both the page list and the combined text should
+        extract once and call this, instead of parsing the PDF a second time.
 
-        combined_text = ""
-        for page_num, page_text in pages:
-            combined_text += f"\n\n<PDF pg {page_num}>\n{page_text}"
+        Args:
+            pages: List of tuples (page_number, page_text)
 
-        return combined_text.strip()
+        Returns:
+            Combined text with <PDF pg #> markers
+        """
+        return "\n\n".join(
+            f"<PDF pg {page_num}>\n{page_text}" for page_num, page_text in pages
+        ).strip()
 
     def _clean_text(self, text: str) -> str:
         """
@@ -248,4 +270,4 @@ class PDFExtractorService:
 
     def get_available_libraries(self) -> List[str]:
         """Return list of available PDF extraction library names."""
-        return [strategy.name for strategy in self.strategies]
+        return list(self._available_libraries)
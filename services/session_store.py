@@ -0,0 +1,160 @@
+"""
+Auth token storage for PM Tools Suite.
+
+Maps login tokens to {username, name, role} with a fixed lifetime.
+
+- InMemorySessionStore: per-process dict (default; one gunicorn worker)
+- RedisSessionStore: shared across workers/hosts, expiry handled by Redis TTL
+
+create_session_store() picks Redis when REDIS_URL is set and redis-py is
+installed, otherwise falls back to memory.
+"""
+
+import heapq
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL_SECONDS = 24 * 60 * 60
+MAX_MEMORY_SESSIONS = 10_000  # per process; logging in past it evicts the oldest token
+REDIS_LOCAL_CACHE_SECONDS = 60  # how long a worker trusts a token it already read from Redis
+REDIS_MAX_CONNECTIONS = 50
+_REDIS_KEY_PREFIX = 'session:'
+
+
+class InMemorySessionStore:
+    """Token -> session dict guarded by a lock; expired entries drop on read or sweep().
+
+    A min-heap of (expires_at, token) lets sweep() pop just the expired
+    tokens instead of scanning every live one. With a fixed TTL the heap head
+    is also the oldest login, so the max_sessions cap evicts from it too.
+    """
+
+    backend = 'memory'
+
+    def __init__(self, ttl: int = SESSION_TTL_SECONDS, max_sessions: int = MAX_MEMORY_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, tuple] = {}  # token -> (expires_at monotonic, session)
+        self._expiry_heap: List[tuple] = []  # (expires_at, token), soonest first
+        self._lock = threading.Lock()
+
+    def create(self, token: str, session: Dict) -> None:
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._sessions[token] = (expires_at, dict(session))
+            heapq.heappush(self._expiry_heap, (expires_at, token))
+            while len(self._sessions) > self.max_sessions:
+                self._pop_oldest()
+
+    def get(self, token: str) -> Optional[Dict]:
+        if not token:
+            return None
+        with self._lock:
+            entry = self._sessions.get(token)
+            if entry is None:
+                return None
+            if time.monotonic() > entry[0]:
+                del self._sessions[token]
+                return None
+            return entry[1]
+
+    def delete(self, token: str) -> None:
+        with self._lock:
+            self._sessions.pop(token, None)
+
+    def sweep(self) -> int:
+        """Drop every expired token; returns how many were removed."""
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            while self._expiry_heap and now > self._expiry_heap[0][0]:
+                removed += self._pop_oldest()
+        return removed
+
+    def _pop_oldest(self) -> bool:
+        """Pop the heap head and drop its token if still live; caller holds the lock."""
+        expires_at, token = heapq.heappop(self._expiry_heap)
+        entry = self._sessions.get(token)
+        # Logged-out or already read-expired tokens leave a stale heap entry
+        if entry is not None and entry[0] == expires_at:
+            del self._sessions[token]
+            return True
+        return False
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class RedisSessionStore:
+    """One `session:<token>` key per login, written with SETEX so Redis expires it.
+
+    Tokens read back are remembered per process for REDIS_LOCAL_CACHE_SECONDS,
+    so every authenticated request and verify-session poll from the same
+    browser doesn't cost a Redis round trip. A token can therefore outlive its
+    Redis key by at most that long on another worker; delete() drops it here.
+    """
+
+    backend = 'redis'
+
+    def __init__(self, client, ttl: int = SESSION_TTL_SECONDS):
+        self.ttl = ttl
+        self._redis = client
+        self._local: Dict[str, tuple] = {}  # token -> (trusted until monotonic, session)
+
+    @classmethod
+    def from_url(cls, url: str, ttl: int = SESSION_TTL_SECONDS) -> 'RedisSessionStore':
+        import redis
+        pool = redis.ConnectionPool.from_url(url, max_connections=REDIS_MAX_CONNECTIONS)
+        return cls(redis.Redis(connection_pool=pool), ttl)
+
+    def create(self, token: str, session: Dict) -> None:
+        self._redis.setex(_REDIS_KEY_PREFIX + token, self.ttl, json.dumps(session))
+
+    def get(self, token: str) -> Optional[Dict]:
+        if not token:
+            return None
+        now = time.monotonic()
+        entry = self._local.get(token)
+        if entry is not None and now < entry[0]:
+            return entry[1]
+        data = self._redis.get(_REDIS_KEY_PREFIX + token)
+        if data is None:
+            self._local.pop(token, None)
+            return None
+        session = json.loads(data)
+        if len(self._local) >= MAX_MEMORY_SESSIONS:
+            self._local.clear()  # rare; every entry is cheap to re-read
+        self._local[token] = (now + REDIS_LOCAL_CACHE_SECONDS, session)
+        return session
+
+    def delete(self, token: str) -> None:
+        self._local.pop(token, None)
+        self._redis.delete(_REDIS_KEY_PREFIX + token)
+
+    def sweep(self) -> int:
+        """Nothing to do - Redis expires keys itself."""
+        return 0
+
+    def __len__(self) -> int:
+        # Only used for diagnostics; SCAN keeps it non-blocking on a shared server
+        return sum(1 for _ in self._redis.scan_iter(match=_REDIS_KEY_PREFIX + '*', count=500))
+
+
+def create_session_store(redis_url: Optional[str] = None, ttl: int = SESSION_TTL_SECONDS):
+    """Redis-backed store when configured and importable, in-memory otherwise."""
+    if redis_url:
+        try:
+            store = RedisSessionStore.from_url(redis_url, ttl)
+            store._redis.ping()
+            logger.info("🔐 Auth sessions stored in Redis")
+            return store
+        except ImportError:
+            logger.warning("⚠️  REDIS_URL set but redis-py is not installed - using in-memory auth sessions")
+        except Exception as e:
+            logger.warning(f"⚠️  Redis unavailable ({e}) - using in-memory auth sessions")
+    return InMemorySessionStore(ttl)
@@ -5,7 +5,6 @@ This verifies the case-sensitivity fix works correctly.
 
 import os
 import sys
-import hashlib
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,7 +12,7 @@ load_dotenv()
 
 # Import after loading .env
 sys.path.insert(0, os.path.dirname(__file__))
-from app import load_authorized_users, AUTHORIZED_USERS
+from app import app, load_authorized_users, AUTHORIZED_USERS, _hash_password, _password_digest, _verify_password
 
 def test_env_loaded():
     """Test that environment variables are loaded correctly."""
@@ -80,7 +79,7 @@ def test_authentication_case_insensitive():
     for submitted_email, submitted_password, should_pass, description in test_cases:
         # Simulate backend authentication logic
         username_lower = submitted_email.strip().lower()
-        password_hash = hashlib.sha256(submitted_password.encode()).hexdigest()
+        password_hash = _password_digest(submitted_password)
 
         # Check if user exists
         user_exists = username_lower in AUTHORIZED_USERS
@@ -88,7 +87,7 @@ def test_authentication_case_insensitive():
         # Check if password matches
         password_matches = False
         if user_exists:
-            password_matches = password_hash == AUTHORIZED_USERS[username_lower]['password_hash']
+            password_matches = _verify_password(username_lower, password_hash)
 
         auth_successful = user_exists and password_matches
 
@@ -118,17 +117,55 @@ def test_password_hashing():
     print("="*70)
 
     user1_password = os.getenv('AUTH_USER1_PASSWORD')
-    expected_hash = hashlib.sha256(user1_password.encode()).hexdigest()
-    stored_hash = AUTHORIZED_USERS['stephenb@munipipe.com']['password_hash']
+    user = AUTHORIZED_USERS['stephenb@munipipe.com']
+    digest = _password_digest(user1_password)
+    expected_hash = _hash_password(digest, user['password_salt'])
+    stored_hash = user['password_hash']
 
-    print(f"  Expected hash: {expected_hash[:40]}...")
-    print(f"  Stored hash:   {stored_hash[:40]}...")
+    print(f"  Expected hash: {expected_hash.hex()[:40]}...")
+    print(f"  Stored hash:   {stored_hash.hex()[:40]}...")
 
     assert expected_hash == stored_hash, "Password hash mismatch"
+    assert stored_hash != digest, "Password stored as plain SHA-256"
+
+    # Same password, fresh salt -> different stored hash
+    other_salt = load_authorized_users()['stephenb@munipipe.com']['password_salt']
+    assert other_salt != user['password_salt'], "Salt reused between loads"
 
     print("\n[PASS] Password hashing works correctly")
 
 
+def test_session_token_roundtrip():
+    """Test that a login token verifies until it is unknown to the session store."""
+    print("\n" + "="*70)
+    print("TEST 5: Session Token Round Trip")
+    print("="*70)
+
+    client = app.test_client()
+    login = client.post('/api/authenticate', json={
+        'username': 'StephenB@munipipe.com',
+        'password': os.getenv('AUTH_USER1_PASSWORD')
+    })
+    assert login.status_code == 200, f"Login failed: {login.status_code}"
+    token = login.json['token']
+
+    verified = client.post('/api/verify-session', json={'token': token})
+    assert verified.status_code == 200 and verified.json['valid'], "Fresh token rejected"
+    assert verified.json['user']['role'] == 'admin'
+    print(f"  Token verified for {verified.json['user']['email']}")
+
+    bogus = client.post('/api/verify-session', json={'token': 'not-a-token'})
+    assert bogus.status_code == 401, "Unknown token accepted"
+    print("  Unknown token rejected")
+
+    stranger = client.post('/api/authenticate', json={'username': 'nobody@example.com', 'password': 'x'})
+    assert stranger.status_code == 401, "Unknown user accepted"
+    assert stranger.json == {'success': False, 'message': 'Invalid credentials'}
+    print("  Unknown user rejected with the same response as a bad password")
+
+    print("\n[PASS] Session tokens verify through the session store")
+
+
 if __name__ == '__main__':
     print("\n" + "="*70)
     print("AUTHENTICATION SYSTEM TESTS")
@@ -139,6 +176,7 @@ if __name__ == '__main__':
         test_users_dictionary()
         test_authentication_case_insensitive()
         test_password_hashing()
+        test_session_token_roundtrip()
 
         print("\n" + "="*70)
         print("[PASS] ALL TESTS PASSED - Authentication system working correctly")
@@ -0,0 +1,109 @@
+"""
+Tests for browser caching on the page, shared-asset and question-config routes.
+
+Repeat visits should revalidate with If-None-Match / If-Modified-Since and
+get a body-less 304 instead of the full file.
+"""
+
+import sys
+import os
+
+# Add parent directory to path so we can import app
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app import app, HTML_PAGES
+
+SHARED_ASSET = '/shared/assets/images/logo.png'
+SHARED_CSS = '/shared/assets/css/common.css'
+
+
+def _client():
+    return app.test_client()
+
+
+def test_html_pages_send_validators():
+    """Every HTML page carries Cache-Control, ETag and Last-Modified."""
+    client = _client()
+    for rule in HTML_PAGES:
+        response = client.get(rule)
+        assert response.status_code == 200, f"{rule} returned {response.status_code}"
+        assert response.headers.get('ETag'), f"{rule} has no ETag"
+        assert response.headers.get('Last-Modified'), f"{rule} has no Last-Modified"
+        assert 'max-age' in response.headers.get('Cache-Control', ''), f"{rule} has no max-age"
+        print(f"  {rule}: {response.headers['Cache-Control']} etag={response.headers['ETag']}")
+    print("\n[PASS] HTML pages send caching validators")
+
+
+def test_html_pages_revalidate_with_304():
+    """If-None-Match and If-Modified-Since both short-circuit to an empty 304."""
+    client = _client()
+    for rule in HTML_PAGES:
+        first = client.get(rule)
+        by_etag = client.get(rule, headers={'If-None-Match': first.headers['ETag']})
+        by_date = client.get(rule, headers={'If-Modified-Since': first.headers['Last-Modified']})
+        assert by_etag.status_code == 304, f"{rule} ignored If-None-Match"
+        assert by_date.status_code == 304, f"{rule} ignored If-Modified-Since"
+        assert by_etag.data == b''
+    print("\n[PASS] HTML pages answer conditional GETs with 304")
+
+
+def test_shared_asset_revalidates_with_304():
+    """Shared images/CSS/JS go through send_from_directory with conditional=True."""
+    client = _client()
+    first = client.get(SHARED_ASSET)
+    assert first.status_code == 200
+    assert 'max-age' in first.headers.get('Cache-Control', '')
+    first.close()
+
+    repeat = client.get(SHARED_ASSET, headers={'If-None-Match': first.headers['ETag']})
+    assert repeat.status_code == 304
+    repeat.close()
+    print("\n[PASS] Shared assets answer conditional GETs with 304")
+
+
+def test_shared_css_served_pre_gzipped():
+    """Small text assets come from memory, gzipped once, with their own ETag."""
+    client = _client()
+    plain = client.get(SHARED_CSS)
+    zipped = client.get(SHARED_CSS, headers={'Accept-Encoding': 'gzip'})
+    assert plain.status_code == 200 and zipped.status_code == 200
+    assert zipped.headers.get('Content-Encoding') == 'gzip'
+    assert len(zipped.data) < len(plain.data)
+    assert zipped.headers['ETag'] != plain.headers['ETag']
+
+    repeat = client.get(SHARED_CSS, headers={'Accept-Encoding': 'gzip',
+                                             'If-None-Match': zipped.headers['ETag']})
+    assert repeat.status_code == 304
+    print(f"  {SHARED_CSS}: {len(plain.data)} -> {len(zipped.data)} bytes gzipped")
+    print("\n[PASS] Shared CSS is served pre-gzipped and revalidates with 304")
+
+
+def test_question_config_revalidates_with_304():
+    """The question config JSON honours If-Modified-Since."""
+    client = _client()
+    first = client.get('/api/config/questions')
+    assert first.status_code == 200
+    assert first.json['success'] is True
+
+    repeat = client.get('/api/config/questions',
+                        headers={'If-Modified-Since': first.headers['Last-Modified']})
+    assert repeat.status_code == 304
+    print("\n[PASS] Question config answers If-Modified-Since with 304")
+
+
+if __name__ == '__main__':
+    try:
+        test_html_pages_send_validators()
+        test_html_pages_revalidate_with_304()
+        test_shared_asset_revalidates_with_304()
+        test_shared_css_served_pre_gzipped()
+        test_question_config_revalidates_with_304()
+
+        print("\n" + "="*70)
+        print("[PASS] ALL TESTS PASSED")
+        print("="*70 + "\n")
+    except AssertionError as e:
+        print("\n" + "="*70)
+        print(f"[FAIL] TEST FAILED: {e}")
+        print("="*70 + "\n")
+        sys.exit(1)
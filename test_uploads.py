@@ -0,0 +1,108 @@
+"""
+Tests for the PDF upload endpoints.
+
+Every upload is written to the private scratch dir (UPLOAD_DIR); a rejected
+or interrupted upload must not leave a partial file behind there.
+"""
+
+import io
+import sys
+import os
+
+# Add parent directory to path so we can import app
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app import app, UPLOAD_DIR
+
+PDF_BODY = b'%PDF-1.4\n' + os.urandom(256 * 1024) + b'\n%%EOF\n'
+
+
+def _client():
+    return app.test_client()
+
+
+def _upload_files():
+    return set(os.listdir(UPLOAD_DIR))
+
+
+def _post_stream(client, body, **kwargs):
+    return client.post('/api/upload/stream', data=body,
+                       headers={'Content-Type': 'application/pdf', 'X-Filename': 'spec%20book.pdf'},
+                       **kwargs)
+
+
+def test_stream_upload_stores_file():
+    """The raw-body upload lands in the scratch dir with the decoded filename and size."""
+    response = _post_stream(_client(), PDF_BODY)
+    assert response.status_code == 200, response.data
+    assert response.json['filename'] == 'spec book.pdf'
+    assert response.json['size'] == len(PDF_BODY)
+    with open(response.json['filepath'], 'rb') as f:
+        assert f.read() == PDF_BODY
+    print(f"  stored {response.json['size']} bytes -> {response.json['filepath']}")
+    print("\n[PASS] Streamed upload stored intact")
+
+
+def test_stream_upload_rejects_empty_body():
+    """An empty body is a 400 and leaves nothing behind."""
+    before = _upload_files()
+    response = _post_stream(_client(), b'')
+    assert response.status_code == 400
+    assert response.json['error'] == 'No file provided'
+    assert _upload_files() == before
+    print("\n[PASS] Empty streamed upload rejected")
+
+
+def test_stream_upload_truncated_body():
+    """A body shorter than its Content-Length is a 400 and the partial file is removed."""
+    before = _upload_files()
+    response = _post_stream(_client(), PDF_BODY[:1000],
+                            environ_overrides={'CONTENT_LENGTH': str(len(PDF_BODY))})
+    assert response.status_code == 400, response.data
+    assert _upload_files() == before, "partial upload left in UPLOAD_DIR"
+    print("\n[PASS] Truncated streamed upload rejected and cleaned up")
+
+
+def test_multipart_upload_rejects_empty_file():
+    """A multipart part with no content is a 400 and leaves nothing behind."""
+    before = _upload_files()
+    response = _client().post('/api/upload', data={'file': (io.BytesIO(b''), 'spec.pdf')},
+                              content_type='multipart/form-data')
+    assert response.status_code == 400, response.data
+    assert response.json['error'] == 'No file provided'
+    assert _upload_files() == before, "empty multipart part left in UPLOAD_DIR"
+    print("\n[PASS] Empty multipart upload rejected")
+
+
+def test_multipart_upload_truncated_body():
+    """A multipart body cut off mid-file leaves no parser-written part behind."""
+    boundary = 'pmtoolsboundary'
+    body = (
+        f'--{boundary}\r\n'
+        'Content-Disposition: form-data; name="file"; filename="spec.pdf"\r\n'
+        'Content-Type: application/pdf\r\n\r\n'
+    ).encode() + PDF_BODY[:100 * 1024]  # no closing boundary
+    before = _upload_files()
+    response = _client().post('/api/upload', data=body,
+                              content_type=f'multipart/form-data; boundary={boundary}')
+    assert response.status_code == 400, response.data
+    assert _upload_files() == before, "truncated multipart part left in UPLOAD_DIR"
+    print("\n[PASS] Truncated multipart upload rejected and cleaned up")
+
+
+if __name__ == '__main__':
+    try:
+        test_stream_upload_stores_file()
+        test_stream_upload_rejects_empty_body()
+        test_stream_upload_truncated_body()
+        test_multipart_upload_rejects_empty_file()
+        test_multipart_upload_truncated_body()
+
+        print("\n" + "="*70)
+        print("[PASS] ALL TESTS PASSED")
+        print("="*70 + "\n")
+    except AssertionError as e:
+        print("\n" + "="*70)
+        print(f"[FAIL] TEST FAILED: {e}")
+        print("="*70 + "\n")
+        sys.exit(1)